@@ -21,6 +21,8 @@ class Amenity(BaseModel):
         created_at (datetime): Creation timestamp (inherited from BaseModel)
         updated_at (datetime): Last update timestamp (inherited from BaseModel)
     """
+
+    __slots__ = ('name',)
     
     def __init__(self, name):
         """
@@ -77,7 +79,7 @@ class Amenity(BaseModel):
         # Call parent update method
         super().update(data)
     
-    def to_dict(self):
+    def _serialize(self):
         """
         Convert the Amenity object to a dictionary representation.
         
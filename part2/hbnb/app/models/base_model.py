@@ -8,6 +8,20 @@ for all business logic entities in the HBnB application.
 import uuid
 from datetime import datetime
 
+# callables told about every save(); a DurableStore uses this to log changes
+# made on an entity outside its repository, such as place.add_review()
+_save_listeners = []
+
+
+def subscribe_saves(listener):
+    """Call listener(entity) after every BaseModel.save()."""
+    _save_listeners.append(listener)
+
+
+def unsubscribe_saves(listener):
+    """Stop calling a listener passed to subscribe_saves()."""
+    _save_listeners.remove(listener)
+
 
 class BaseModel:
     """
@@ -17,7 +31,13 @@ class BaseModel:
     - Unique identifier generation (UUID)
     - Timestamp management (created_at, updated_at)
     - Update functionality
+
+    Entities declare their attributes in __slots__ instead of carrying a
+    per-instance __dict__, which keeps large in-memory datasets compact.
+    Subclasses must list every attribute they set in their own __slots__.
     """
+
+    __slots__ = ('id', 'created_at', 'updated_at', '_dict_cache')
     
     def __init__(self):
         """
@@ -29,17 +49,23 @@ class BaseModel:
         - updated_at: Current timestamp
         """
         self.id = str(uuid.uuid4())
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # one datetime shared by both fields until the first save()
+        self.created_at = self.updated_at = datetime.now()
+        # (updated_at, dict, sequence keys) of the last to_dict(), dropped by save()
+        self._dict_cache = None
     
     def save(self):
         """
         Update the updated_at timestamp whenever the object is modified.
         
         This method should be called whenever the object's state changes
-        to maintain accurate modification timestamps.
+        to maintain accurate modification timestamps. It also drops the
+        cached to_dict() result and tells the save listeners.
         """
         self.updated_at = datetime.now()
+        self._dict_cache = None
+        for listener in _save_listeners:
+            listener(self)
     
     def update(self, data):
         """
@@ -65,20 +91,52 @@ class BaseModel:
         """
         Convert the object to a dictionary representation.
         
+        The dictionary built by _serialize() is cached until the next
+        save() (or a change of updated_at), so reading an unchanged entity
+        again skips serialization and only copies the cached dictionary.
+        Sequence values are copied into fresh lists, so a caller changing
+        the result cannot change what later calls return.
+        
+        Returns:
+            dict: Dictionary containing all object attributes
+        """
+        cached = self._dict_cache
+        if cached is None or cached[0] != self.updated_at:
+            data = self._serialize()
+            sequences = tuple(key for key, value in data.items() if isinstance(value, (tuple, list)))
+            cached = self._dict_cache = (self.updated_at, data, sequences)
+        result = dict(cached[1])
+        for key in cached[2]:
+            result[key] = list(result[key])
+        return result
+    
+    def _serialize(self):
+        """
+        Build the dictionary representation. Subclasses override this
+        instead of to_dict() to get the caching; sequence values are best
+        returned as tuples, which to_dict() turns into lists.
+        
         Returns:
             dict: Dictionary containing all object attributes
         """
         result = {}
-        for key, value in self.__dict__.items():
+        for key, value in self._attributes():
             if isinstance(value, datetime):
                 result[key] = value.isoformat()
             else:
                 result[key] = value
         return result
     
+    def _attributes(self):
+        """Yields (name, value) for every public slot that is set, base class first."""
+        for cls in reversed(type(self).__mro__):
+            for name in cls.__dict__.get('__slots__', ()):
+                if not name.startswith('_') and hasattr(self, name):
+                    yield name, getattr(self, name)
+    
     def __str__(self):
         """String representation of the object."""
-        return f"[{self.__class__.__name__}] ({self.id}) {self.__dict__}"
+        return f"[{self.__class__.__name__}] ({self.id}) {dict(self._attributes())}"
     
     def __repr__(self):
         """Detailed string representation of the object."""
@@ -6,6 +6,7 @@ in the system, including their details, location, and relationships.
 """
 
 from .base_model import BaseModel
+from .relationship import RelatedCollection
 
 
 class Place(BaseModel):
@@ -20,11 +21,13 @@ class Place(BaseModel):
         latitude (float): Latitude coordinate (-90.0 to 90.0)
         longitude (float): Longitude coordinate (-180.0 to 180.0)
         owner (User): User instance who owns the place
-        reviews (list): List of Review instances for this place
-        amenities (list): List of Amenity instances for this place
+        reviews (RelatedCollection): Review instances for this place
+        amenities (RelatedCollection): Amenity instances for this place
         created_at (datetime): Creation timestamp (inherited from BaseModel)
         updated_at (datetime): Last update timestamp (inherited from BaseModel)
     """
+
+    __slots__ = ('title', 'description', 'price', 'latitude', 'longitude', 'owner', 'reviews', 'amenities')
     
     def __init__(self, title, description, price, latitude, longitude, owner):
         """
@@ -52,9 +55,9 @@ class Place(BaseModel):
         self.longitude = self._validate_longitude(longitude)
         self.owner = self._validate_owner(owner)
         
-        # Initialize relationship lists
-        self.reviews = []
-        self.amenities = []
+        # Initialize relationship collections
+        self.reviews = RelatedCollection()
+        self.amenities = RelatedCollection()
     
     def _validate_title(self, title):
         """
@@ -207,7 +210,7 @@ class Place(BaseModel):
         if review in self.reviews:
             raise ValueError("Review is already associated with this place")
         
-        self.reviews.append(review)
+        self.reviews.add(review)
         self.save()
     
     def remove_review(self, review):
@@ -220,8 +223,7 @@ class Place(BaseModel):
         Returns:
             bool: True if review was removed, False if not found
         """
-        if review in self.reviews:
-            self.reviews.remove(review)
+        if self.reviews.discard(review):
             self.save()
             return True
         return False
@@ -245,7 +247,7 @@ class Place(BaseModel):
         if amenity in self.amenities:
             raise ValueError("Amenity is already associated with this place")
         
-        self.amenities.append(amenity)
+        self.amenities.add(amenity)
         self.save()
     
     def remove_amenity(self, amenity):
@@ -258,8 +260,7 @@ class Place(BaseModel):
         Returns:
             bool: True if amenity was removed, False if not found
         """
-        if amenity in self.amenities:
-            self.amenities.remove(amenity)
+        if self.amenities.discard(amenity):
             self.save()
             return True
         return False
@@ -296,7 +297,7 @@ class Place(BaseModel):
         # Call parent update method
         super().update(data)
     
-    def to_dict(self):
+    def _serialize(self):
         """
         Convert the Place object to a dictionary representation.
         
@@ -311,8 +312,8 @@ class Place(BaseModel):
             'latitude': self.latitude,
             'longitude': self.longitude,
             'owner_id': self.owner.id,
-            'reviews': [review.id for review in self.reviews],
-            'amenities': [amenity.id for amenity in self.amenities],
+            'reviews': self.reviews.ids,
+            'amenities': self.amenities.ids,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
@@ -0,0 +1,90 @@
+"""
+Relationship collection for the HBnB models.
+
+This module provides RelatedCollection, the container behind one-to-many
+and many-to-many attributes such as Place.reviews and Place.amenities.
+"""
+
+
+class RelatedCollection:
+    """
+    Insertion-ordered collection of entities keyed by their id.
+
+    Membership tests, add() and remove() are O(1) dict operations, while
+    iteration, len() and indexing behave like the list it replaces.
+    Entities are compared by id, as Review.__eq__ and Amenity.__eq__ do.
+    The ids property is computed once and reused until the next change.
+    """
+
+    __slots__ = ('_items', '_ids')
+
+    def __init__(self, items=()):
+        """
+        Initialize the collection.
+
+        Args:
+            items (iterable): Entities to start with, in order
+        """
+        self._items = {}
+        self._ids = None
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        """Append an entity (an entity already present keeps its position)."""
+        self._items[item.id] = item
+        self._ids = None
+
+    append = add
+
+    def remove(self, item):
+        """
+        Remove an entity.
+
+        Raises:
+            ValueError: If the entity is not in the collection, like list.remove
+        """
+        if self._items.pop(getattr(item, 'id', None), None) is None:
+            raise ValueError(f"{item!r} is not in the collection")
+        self._ids = None
+
+    def discard(self, item):
+        """Remove an entity if present. Returns True if it was removed."""
+        if self._items.pop(getattr(item, 'id', None), None) is None:
+            return False
+        self._ids = None
+        return True
+
+    @property
+    def ids(self):
+        """Tuple of the entity ids in order, cached until the collection changes."""
+        if self._ids is None:
+            self._ids = tuple(self._items)
+        return self._ids
+
+    def __contains__(self, item):
+        return getattr(item, 'id', None) in self._items
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return list(self._items.values())[index]
+
+    def __eq__(self, other):
+        if isinstance(other, RelatedCollection):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __reduce__(self):
+        # the items are copied in one step, so a collection changed by
+        # another thread while a snapshot pickles it is never half-written
+        return (RelatedCollection, (tuple(self._items.values()),))
+
+    def __repr__(self):
+        return f"RelatedCollection({list(self._items.values())!r})"
@@ -21,6 +21,8 @@ class Review(BaseModel):
         created_at (datetime): Creation timestamp (inherited from BaseModel)
         updated_at (datetime): Last update timestamp (inherited from BaseModel)
     """
+
+    __slots__ = ('text', 'rating', 'place', 'user')
     
     def __init__(self, text, rating, place, user):
         """
@@ -187,7 +189,7 @@ class Review(BaseModel):
         # Call parent update method
         super().update(data)
     
-    def to_dict(self):
+    def _serialize(self):
         """
         Convert the Review object to a dictionary representation.
         
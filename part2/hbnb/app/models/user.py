@@ -22,6 +22,8 @@ class User(BaseModel):
         created_at (datetime): Creation timestamp (inherited from BaseModel)
         updated_at (datetime): Last update timestamp (inherited from BaseModel)
     """
+
+    __slots__ = ('first_name', 'last_name', 'email', 'is_admin')
     
     def __init__(self, first_name, last_name, email, is_admin=False):
         """
@@ -123,7 +125,7 @@ class User(BaseModel):
         # Call parent update method
         super().update(data)
     
-    def to_dict(self):
+    def _serialize(self):
         """
         Convert the User object to a dictionary representation.
         
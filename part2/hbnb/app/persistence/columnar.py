@@ -0,0 +1,128 @@
+"""
+Columnar sidecar for searching places.
+
+PlaceColumns keeps price, latitude, longitude and the average review
+rating of every place in NumPy arrays, row-aligned with an array of place
+ids. It subscribes to the place and review repositories, so it follows
+every add/update/delete incrementally, and search() evaluates all the
+predicates as vectorized masks instead of looping over Place objects.
+"""
+
+import threading
+
+# Optional dependency (vectorized place search)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class PlaceColumns:
+    """Place search columns. Requires numpy."""
+
+    COLUMNS = ('price', 'latitude', 'longitude')
+
+    def __init__(self, capacity=1024):
+        if np is None:
+            raise RuntimeError("PlaceColumns requires the numpy package")
+        self._lock = threading.Lock()
+        self._size = 0
+        self._rows = {}  # place id -> row
+        self._ids = np.empty(capacity, dtype=object)
+        self._columns = {name: np.empty(capacity) for name in self.COLUMNS}
+        self._rating = np.empty(capacity)
+        # place id -> [rating sum, review count]; kept for places not
+        # (yet) in the columns too, so load order does not matter
+        self._ratings = {}
+        self._review_ratings = {}  # review id -> (place id, rating) it counted for
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self):
+        capacity = 2 * len(self._ids)
+        self._ids = np.resize(self._ids, capacity)
+        self._columns = {name: np.resize(column, capacity) for name, column in self._columns.items()}
+        self._rating = np.resize(self._rating, capacity)
+
+    def _average(self, place_id):
+        total, count = self._ratings.get(place_id, (0, 0))
+        return total / count if count else np.nan
+
+    def _put(self, place):
+        row = self._rows.get(place.id)
+        if row is None:
+            if self._size == len(self._ids):
+                self._grow()
+            row = self._rows[place.id] = self._size
+            self._size += 1
+            self._ids[row] = place.id
+        for name, column in self._columns.items():
+            column[row] = getattr(place, name)
+        self._rating[row] = self._average(place.id)
+
+    def _remove(self, place_id):
+        """Moves the last row into the freed one, keeping the arrays dense."""
+        row = self._rows.pop(place_id, None)
+        if row is None:
+            return
+        last = self._size - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            for column in self._columns.values():
+                column[row] = column[last]
+            self._rating[row] = self._rating[last]
+            self._rows[moved_id] = row
+        self._ids[last] = None
+        self._size = last
+
+    def _count_rating(self, place_id, rating, sign):
+        totals = self._ratings.setdefault(place_id, [0, 0])
+        totals[0] += sign * rating
+        totals[1] += sign
+        if not totals[1]:
+            del self._ratings[place_id]
+        row = self._rows.get(place_id)
+        if row is not None:
+            self._rating[row] = self._average(place_id)
+
+    def on_place(self, event, place):
+        """Listener for the place repository."""
+        with self._lock:
+            if event == 'delete':
+                self._remove(place.id)
+            else:
+                self._put(place)
+
+    def on_review(self, event, review):
+        """Listener for the review repository."""
+        with self._lock:
+            counted = self._review_ratings.pop(review.id, None)
+            if counted is not None:
+                self._count_rating(*counted, -1)
+            if event != 'delete':
+                counted = self._review_ratings[review.id] = (review.place.id, review.rating)
+                self._count_rating(*counted, 1)
+
+    def search(self, price=None, latitude=None, longitude=None, min_rating=None):
+        """
+        Ids of the places inside every given (lo, hi) range (None leaves a
+        side open) and, with min_rating, whose average rating is at least
+        that. Places without reviews have no rating and never match it.
+        """
+        with self._lock:
+            size = self._size
+            mask = np.ones(size, dtype=bool)
+            for name, bounds in (('price', price), ('latitude', latitude), ('longitude', longitude)):
+                if bounds is None:
+                    continue
+                lo, hi = bounds
+                column = self._columns[name][:size]
+                if lo is not None:
+                    mask &= column >= lo
+                if hi is not None:
+                    mask &= column <= hi
+            if min_rating is not None:
+                mask &= self._rating[:size] >= min_rating
+            return self._ids[:size][mask].tolist()
@@ -0,0 +1,352 @@
+"""
+Durable mode for the in-memory repositories.
+
+A DurableStore keeps the objects of all its repositories in memory, as
+before, and also writes every add/update/delete to an append-only log.
+Every `snapshot_every` records (or on snapshot() and close()) the whole
+state is pickled into one snapshot file and a fresh log is started. On
+open() the latest snapshot is memory-mapped and unpickled, then the logs
+written after it are replayed, so a restart never rebuilds the data object
+by object.
+
+Files in the data directory, for generation N:
+    snapshot-N.pkl   state of every repository when generation N started
+    log-N.bin        records since then: <length><crc32><pickle> each
+
+Changes made directly on a stored entity (e.g. place.add_review()) are
+logged too: every BaseModel.save() outside a repository call writes the
+entity's attributes as an update record.
+"""
+
+import gc
+import io
+import mmap
+import os
+import pickle
+import re
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+from datetime import date, datetime
+from app.models.base_model import subscribe_saves, unsubscribe_saves
+from app.persistence.repository import ConcurrentInMemoryRepository, InMemoryRepository
+
+RECORD_HEADER = struct.Struct('<II')  # payload length, crc32 of payload
+PICKLE_PROTOCOL = 5
+FILE_PATTERN = re.compile(r'^(snapshot|log)-(\d+)\.(pkl|bin)$')
+# values that can never be a stored entity, skipped without a lookup
+PLAIN_TYPES = frozenset((str, int, float, bool, type(None), bytes, tuple, list, dict, set,
+                         date, datetime))
+
+
+class _LogPickler(pickle.Pickler):
+    """Writes objects stored in a repository as (repository, id) references."""
+
+    def __init__(self, file, store, root=None):
+        super().__init__(file, protocol=PICKLE_PROTOCOL)
+        self.store = store
+        self.root = root
+
+    def persistent_id(self, obj):
+        if type(obj) in PLAIN_TYPES or obj is self.root:
+            return None
+        obj_id = getattr(obj, 'id', None)
+        if type(obj_id) is not str:
+            return None
+        for name, repo in self.store.repositories.items():
+            if repo._storage.get(obj_id) is obj:
+                return (name, obj_id)
+        return None
+
+
+class _LogUnpickler(pickle.Unpickler):
+    """Resolves (repository, id) references against the objects loaded so far."""
+
+    def __init__(self, file, store):
+        super().__init__(file)
+        self.store = store
+
+    def persistent_load(self, pid):
+        name, obj_id = pid
+        try:
+            return self.store.repositories[name]._storage[obj_id]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Log references unknown {name} '{obj_id}'") from None
+
+
+class DurableInMemoryRepository(ConcurrentInMemoryRepository):
+    """ConcurrentInMemoryRepository whose writes are logged by its DurableStore."""
+
+    def __init__(self, store, name, indexes=(), unique=(), ranges=(), stripes=16):
+        super().__init__(indexes=indexes, unique=unique, ranges=ranges, stripes=stripes)
+        self._store = store
+        self.name = name
+
+    def add(self, obj):
+        with self._store.writing():
+            super().add(obj)
+            self._store.append(('add', self.name, obj), root=obj)
+
+    def update(self, obj_id, data):
+        with self._store.writing():
+            super().update(obj_id, data)
+            obj = self._storage.get(obj_id)
+            if obj:
+                # log the values as stored (models normalize them), not as given
+                values = {key: getattr(obj, key) for key in data if hasattr(obj, key)}
+                values['updated_at'] = obj.updated_at
+                self._store.append(('update', self.name, obj_id, values))
+
+    def delete(self, obj_id):
+        with self._store.writing():
+            if obj_id in self._storage:
+                super().delete(obj_id)
+                self._store.append(('delete', self.name, obj_id))
+
+    def _state(self):
+        """
+        Copy of the storage and indexes for a snapshot, taken under the
+        store lock and pickled after it is released. Hash index buckets
+        are copy-on-write (see ConcurrentInMemoryRepository), so copying
+        each index dict is enough; sorted indexes are copied chunk by chunk.
+        """
+        return (tuple(self._indexes), tuple(self._ranges), dict(self._storage),
+                {attr: dict(index) for attr, index in self._indexes.items()},
+                {attr: index.copy() for attr, index in self._ranges.items()},
+                dict(self._indexed_values))
+
+    def _load_state(self, state):
+        index_attrs, range_attrs, storage, indexes, ranges, indexed_values = state
+        self._storage = storage
+        if index_attrs == tuple(self._indexes) and range_attrs == tuple(self._ranges):
+            self._indexes, self._ranges, self._indexed_values = indexes, ranges, indexed_values
+        else:  # indexes declared differently since the snapshot: rebuild them
+            for obj in storage.values():
+                self._index(obj, self._index_values(obj))
+        if self._listeners:
+            for obj in storage.values():
+                self._notify('add', obj)
+        self._snapshot = None
+
+    def _replay(self, record):
+        op, _, *args = record
+        if op == 'add':
+            InMemoryRepository.add(self, args[0])
+        elif op == 'update':
+            obj_id, values = args
+            obj = self._storage[obj_id]
+            for key, value in values.items():
+                setattr(obj, key, value)
+            if self._indexed_attrs:
+                self._reindex(obj)
+            self._notify('update', obj)
+        elif op == 'delete':
+            InMemoryRepository.delete(self, args[0])
+        self._snapshot = None
+
+
+class DurableStore:
+    """
+    Owns the log and snapshots of a data directory. Create the repositories
+    with repository(), then call open() once before serving.
+
+    Reads stay lock-free; writes are serialized on the log. With fsync=False
+    a record is handed to the OS on every write but only forced to disk on
+    snapshots and close(), so a machine crash (not a process crash) can lose
+    the last writes.
+
+    Snapshots triggered by snapshot_every are pickled on a background
+    thread: writers only wait while the state is copied and a new log is
+    started. Objects changed during the pickling may be written in their
+    newer state; replaying the log over them converges to the same result.
+    """
+
+    def __init__(self, directory, snapshot_every=100000, fsync=False):
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.repositories = {}
+        self.lock = threading.RLock()
+        self.generation = 0
+        self._log = None
+        self._records = 0
+        self._snapshot_thread = None
+        # set while the current thread is inside a repository write
+        self._local = threading.local()
+
+    def repository(self, name, **options):
+        if self._log is not None:
+            raise RuntimeError("Register repositories before opening the store")
+        repo = DurableInMemoryRepository(self, name, **options)
+        self.repositories[name] = repo
+        return repo
+
+    def _path(self, kind, generation):
+        extension = 'pkl' if kind == 'snapshot' else 'bin'
+        return os.path.join(self.directory, f"{kind}-{generation}.{extension}")
+
+    def open(self):
+        """
+        Loads the latest snapshot, replays the logs written since (more than
+        one if the process stopped while a snapshot was being written) and
+        opens the newest log for appending.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        files = {}
+        for match in map(FILE_PATTERN.match, os.listdir(self.directory)):
+            if match:
+                files.setdefault(match.group(1), []).append(int(match.group(2)))
+        snapshot = max(files.get('snapshot', ()), default=0)
+        logs = sorted(generation for generation in files.get('log', ()) if generation >= snapshot)
+        # loading only allocates long-lived objects: collecting meanwhile
+        # would rescan them over and over and roughly doubles the load time
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if snapshot:
+                self._load_snapshot(self._path('snapshot', snapshot))
+            self._records = 0
+            for generation in logs:
+                self._records += self._replay_log(self._path('log', generation))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self.generation = max([snapshot, *logs])
+        self._log = open(self._path('log', self.generation), 'ab')
+        subscribe_saves(self._on_save)
+
+    @contextmanager
+    def writing(self):
+        """Holds the log lock for a repository write; saves inside it are not logged again."""
+        with self.lock:
+            outer = getattr(self._local, 'writing', False)
+            self._local.writing = True
+            try:
+                yield
+            finally:
+                self._local.writing = outer
+
+    def _on_save(self, obj):
+        """Logs an entity saved outside a repository write, if it is stored here."""
+        if self._log is None or getattr(self._local, 'writing', False):
+            return
+        for name, repo in self.repositories.items():
+            if repo._storage.get(obj.id) is obj:
+                values = {key: value for key, value in obj._attributes() if key != 'id'}
+                with self.writing():
+                    self.append(('update', name, obj.id, values))
+                return
+
+    def _load_snapshot(self, path):
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            states = pickle.loads(data)
+        for name, state in states.items():
+            if name in self.repositories:
+                self.repositories[name]._load_state(state)
+
+    def _replay_log(self, path):
+        """Applies every complete record; a torn record at the tail is cut off."""
+        count = 0
+        with open(path, 'r+b') as f:
+            end = os.fstat(f.fileno()).st_size
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if end else b''
+            offset = 0
+            try:
+                while offset + RECORD_HEADER.size <= end:
+                    length, crc = RECORD_HEADER.unpack_from(data, offset)
+                    start = offset + RECORD_HEADER.size
+                    payload = data[start:start + length]
+                    if len(payload) < length or zlib.crc32(payload) != crc:
+                        break
+                    record = _LogUnpickler(io.BytesIO(payload), self).load()
+                    self.repositories[record[1]]._replay(record)
+                    offset = start + length
+                    count += 1
+            finally:
+                if end:
+                    data.close()
+            if offset < end:
+                f.truncate(offset)
+        return count
+
+    def append(self, record, root=None):
+        """Writes one record to the log (callers hold self.lock)."""
+        if self._log is None:
+            raise RuntimeError("DurableStore.open() has not been called")
+        buffer = io.BytesIO()
+        _LogPickler(buffer, self, root).dump(record)
+        payload = buffer.getvalue()
+        self._log.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+        self._records += 1
+        if self._records >= self.snapshot_every and not self._snapshot_running():
+            generation, states = self._start_generation()
+            self._snapshot_thread = threading.Thread(
+                target=self._write_snapshot, args=(generation, states),
+                name=f"snapshot-{generation}", daemon=True)
+            self._snapshot_thread.start()
+
+    def _snapshot_running(self):
+        return self._snapshot_thread is not None and self._snapshot_thread.is_alive()
+
+    def _start_generation(self):
+        """
+        Copies the state of every repository and moves writes to the log of
+        a new generation (callers hold self.lock). Returns the generation
+        and the copied states its snapshot is to be written from.
+        """
+        generation = self.generation + 1
+        states = {name: repo._state() for name, repo in self.repositories.items()}
+        if self._log is not None:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log.close()
+        self._log = open(self._path('log', generation), 'ab')
+        self.generation = generation
+        self._records = 0
+        return generation, states
+
+    def _write_snapshot(self, generation, states):
+        """Pickles states as snapshot-<generation>, then removes older generations."""
+        path = self._path('snapshot', generation)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(states, f, protocol=PICKLE_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + '.tmp', path)
+
+        for filename in os.listdir(self.directory):
+            match = FILE_PATTERN.match(filename)
+            if match and int(match.group(2)) < generation:
+                os.remove(os.path.join(self.directory, filename))
+
+    def _wait_for_snapshot(self):
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+
+    def snapshot(self):
+        """
+        Writes the state of every repository to a new snapshot and waits
+        for it, starts a new log and removes the files of older generations.
+        Writes only wait while the state is copied.
+        """
+        with self.lock:
+            self._wait_for_snapshot()
+            generation, states = self._start_generation()
+        self._write_snapshot(generation, states)
+
+    def close(self):
+        """Writes a final snapshot, so the next open() has no log to replay, and closes the log."""
+        with self.lock:
+            if self._log is None:
+                return
+            unsubscribe_saves(self._on_save)
+            self._wait_for_snapshot()
+            generation, states = self._start_generation()
+            self._write_snapshot(generation, states)
+            self._log.close()
+            self._log = None
@@ -1,4 +1,6 @@
+import threading
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
 
 class Repository(ABC):
     @abstractmethod
@@ -26,12 +28,237 @@ class Repository(ABC):
         pass
 
 
+def _in_range(value, lo, hi):
+    return value is not None and (lo is None or lo <= value) and (hi is None or value <= hi)
+
+
+class _Top:
+    """Sorts after any id, so (value, _TOP) comes after every (value, id)."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_TOP = _Top()
+# old value of an attribute that was not indexed yet
+_UNSET = object()
+
+
+class SortedIndex:
+    """
+    (value, id) pairs kept sorted in chunks of up to 2 * load entries, so
+    an insert or removal shifts one chunk instead of the whole index (the
+    layout of sortedcontainers.SortedList). Values must be comparable with
+    each other and not None.
+
+    A Fenwick tree over the chunk lengths turns a (chunk, offset) position
+    into an absolute one in O(log n), so count() never sums chunks. It is
+    updated in place while chunks only grow or shrink, and rebuilt on the
+    next count() after a chunk is split or dropped.
+    """
+
+    def __init__(self, load=500):
+        self._load = load
+        self._chunks = []
+        self._maxes = []  # last key of each chunk
+        self._len = 0
+        self._tree = None  # Fenwick tree of chunk lengths, None until needed
+
+    def __len__(self):
+        return self._len
+
+    def copy(self):
+        """Independent SortedIndex with the same entries."""
+        other = SortedIndex(self._load)
+        other._chunks = [list(chunk) for chunk in self._chunks]
+        other._maxes = list(self._maxes)
+        other._len = self._len
+        return other
+
+    def _build_tree(self):
+        tree = [0] + [len(chunk) for chunk in self._chunks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _resize(self, i, delta):
+        """Chunk i grew or shrank by delta entries."""
+        self._len += delta
+        tree = self._tree
+        if tree is None:
+            return
+        i += 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, chunk, offset):
+        """Absolute position of entry `offset` of chunk `chunk`."""
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        while chunk > 0:
+            offset += tree[chunk]
+            chunk -= chunk & -chunk
+        return offset
+
+    def add(self, value, obj_id):
+        key = (value, obj_id)
+        if not self._maxes:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            self._len += 1
+            self._tree = None
+            return
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            i -= 1
+            self._chunks[i].append(key)
+            self._maxes[i] = key
+        else:
+            insort(self._chunks[i], key)
+        self._resize(i, 1)
+        chunk = self._chunks[i]
+        if len(chunk) > 2 * self._load:
+            self._chunks[i:i + 1] = [chunk[:self._load], chunk[self._load:]]
+            self._maxes[i:i + 1] = [chunk[self._load - 1], chunk[-1]]
+            self._tree = None
+
+    def remove(self, value, obj_id):
+        key = (value, obj_id)
+        i = bisect_left(self._maxes, key)
+        chunk = self._chunks[i]
+        del chunk[bisect_left(chunk, key)]
+        if chunk:
+            self._maxes[i] = chunk[-1]
+            self._resize(i, -1)
+        else:
+            del self._chunks[i]
+            del self._maxes[i]
+            self._len -= 1
+            self._tree = None
+
+    def _position(self, key):
+        """(chunk, offset) of the first entry >= key."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return i, 0
+        return i, bisect_left(self._chunks[i], key)
+
+    def _bounds(self, lo, hi):
+        start = (0, 0) if lo is None else self._position((lo,))
+        end = (len(self._chunks), 0) if hi is None else self._position((hi, _TOP))
+        return start, max(start, end)
+
+    def count(self, lo=None, hi=None):
+        """Number of entries with lo <= value <= hi in O(log n), without materializing them."""
+        start, end = self._bounds(lo, hi)
+        return self._offset(*end) - self._offset(*start)
+
+    def ids(self, lo=None, hi=None):
+        """Ids of the entries with lo <= value <= hi, ordered by (value, id)."""
+        (first, offset), (last, end) = self._bounds(lo, hi)
+        result = []
+        for i in range(first, min(last + 1, len(self._chunks))):
+            chunk = self._chunks[i]
+            stop = end if i == last else len(chunk)
+            result.extend(obj_id for _, obj_id in chunk[offset if i == first else 0:stop])
+        return result
+
+
 class InMemoryRepository(Repository):
-    def __init__(self):
+    """
+    Dict-backed repository. Attributes listed in `indexes` (or `unique`, which
+    also rejects a second object with the same value) get a hash index, so
+    get_by_attribute()/find_by() on them are dict lookups instead of scans.
+    Attributes listed in `ranges` get a sorted index for range() and
+    find_in_ranges(). Change indexed attributes through update() so the
+    indexes follow. Callables registered with subscribe() are told about
+    every change, to keep derived structures (e.g. PlaceColumns) in step.
+    """
+
+    def __init__(self, indexes=(), unique=(), ranges=()):
         self._storage = {}
+        self._unique = frozenset(unique)
+        # attr -> value -> {obj_id: obj}, insertion ordered like _storage
+        self._indexes = {attr: {} for attr in dict.fromkeys((*unique, *indexes))}
+        # attr -> SortedIndex of (value, id)
+        self._ranges = {attr: SortedIndex() for attr in dict.fromkeys(ranges)}
+        self._indexed_attrs = (*self._indexes, *self._ranges)
+        # obj_id -> indexed values at the time it was (re)indexed
+        self._indexed_values = {}
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """listener(event, obj) is called after each 'add', 'update' and 'delete'."""
+        self._listeners.append(listener)
+
+    def _notify(self, event, obj):
+        for listener in self._listeners:
+            listener(event, obj)
+
+    def _index_values(self, obj):
+        return tuple(getattr(obj, attr, None) for attr in self._indexed_attrs)
+
+    def _check_unique(self, obj_id, values):
+        for attr, value in zip(self._indexes, values):
+            if attr in self._unique and value is not None:
+                holders = self._indexes[attr].get(value)
+                if holders and (len(holders) > 1 or obj_id not in holders):
+                    raise ValueError(f"{attr} '{value}' is already in use")
+
+    def _bucket_add(self, index, value, obj):
+        index.setdefault(value, {})[obj.id] = obj
+
+    def _bucket_remove(self, index, value, obj_id):
+        holders = index[value]
+        del holders[obj_id]
+        if not holders:
+            del index[value]
+
+    def _index(self, obj, values, old_values=None):
+        """
+        Files obj under values in every index. With old_values (it was
+        indexed before), only the attributes whose value changed move.
+        """
+        if old_values is None:
+            old_values = (_UNSET,) * len(values)
+        self._indexed_values[obj.id] = values
+        for attr, old, value in zip(self._indexes, old_values, values):
+            if value != old:
+                self._bucket_add(self._indexes[attr], value, obj)
+                if old is not _UNSET:
+                    self._bucket_remove(self._indexes[attr], old, obj.id)
+        n = len(self._indexes)
+        for attr, old, value in zip(self._ranges, old_values[n:], values[n:]):
+            if value != old:
+                if old is not _UNSET and old is not None:
+                    self._ranges[attr].remove(old, obj.id)
+                if value is not None:
+                    self._ranges[attr].add(value, obj.id)
+
+    def _unindex(self, obj_id):
+        values = self._indexed_values.pop(obj_id, None)
+        if values is None:
+            return
+        for attr, value in zip(self._indexes, values):
+            self._bucket_remove(self._indexes[attr], value, obj_id)
+        for attr, value in zip(self._ranges, values[len(self._indexes):]):
+            if value is not None:
+                self._ranges[attr].remove(value, obj_id)
 
     def add(self, obj):
+        if self._indexed_attrs:
+            values = self._index_values(obj)
+            self._check_unique(obj.id, values)
+            self._index(obj, values, self._indexed_values.get(obj.id))
         self._storage[obj.id] = obj
+        self._notify('add', obj)
 
     def get(self, obj_id):
         return self._storage.get(obj_id)
@@ -39,14 +266,154 @@ class InMemoryRepository(Repository):
     def get_all(self):
         return list(self._storage.values())
 
+    def _reindex(self, obj):
+        """Moves obj to its new index buckets after its attributes changed."""
+        old_values = self._indexed_values[obj.id]
+        values = self._index_values(obj)
+        if values != old_values:
+            try:
+                self._check_unique(obj.id, values)
+            except ValueError:
+                for attr, value in zip(self._indexed_attrs, old_values):
+                    setattr(obj, attr, value)
+                raise
+            self._index(obj, values, old_values)
+
+    def _values(self):
+        """What unindexed scans iterate over."""
+        return self._storage.values()
+
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
             obj.update(data)
+            if self._indexed_attrs:
+                self._reindex(obj)
+            self._notify('update', obj)
 
     def delete(self, obj_id):
-        if obj_id in self._storage:
-            del self._storage[obj_id]
+        obj = self._storage.pop(obj_id, None)
+        if obj is not None:
+            self._unindex(obj_id)
+            self._notify('delete', obj)
 
     def get_by_attribute(self, attr_name, attr_value):
-        return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
\ No newline at end of file
+        if attr_name in self._indexes:
+            holders = self._indexes[attr_name].get(attr_value)
+            return next(iter(holders.values())) if holders else None
+        return next((obj for obj in self._values() if getattr(obj, attr_name) == attr_value), None)
+
+    def find_by(self, attr_name, attr_value):
+        """All objects whose attribute equals the value, in insertion order."""
+        if attr_name in self._indexes:
+            return list(self._indexes[attr_name].get(attr_value, {}).values())
+        return [obj for obj in self._values() if getattr(obj, attr_name) == attr_value]
+
+    def range(self, attr_name, lo=None, hi=None):
+        """
+        Objects with lo <= attribute <= hi, ordered by the attribute
+        (None leaves that side open). Objects whose attribute is None are
+        never in a range.
+        """
+        if attr_name not in self._ranges:
+            matches = [obj for obj in self._values()
+                       if _in_range(getattr(obj, attr_name), lo, hi)]
+            return sorted(matches, key=lambda obj: (getattr(obj, attr_name), obj.id))
+        return [self._storage[obj_id] for obj_id in self._ranges[attr_name].ids(lo, hi)]
+
+    def find_in_ranges(self, **bounds):
+        """
+        Objects inside every given (lo, hi) range, e.g.
+        find_in_ranges(price=(50, 100), latitude=(10.0, None)).
+        Walks the narrowest indexed range and checks the others on each
+        candidate, so the cost follows the most selective bound.
+        """
+        indexed = [attr for attr in bounds if attr in self._ranges]
+        if not indexed:
+            candidates = self._values()
+        else:
+            narrowest = min(indexed, key=lambda attr: self._ranges[attr].count(*bounds[attr]))
+            candidates = [self._storage[obj_id] for obj_id in self._ranges[narrowest].ids(*bounds[narrowest])]
+        return [obj for obj in candidates
+                if all(_in_range(getattr(obj, attr), lo, hi) for attr, (lo, hi) in bounds.items())]
+
+
+class ConcurrentInMemoryRepository(InMemoryRepository):
+    """
+    InMemoryRepository for threaded servers.
+
+    get() is a single dict read, and get_all() and unindexed scans read a
+    copy-on-write snapshot that adds and deletes replace, so they never
+    wait on a lock. Hash index buckets are copy-on-write too: writers
+    build a new bucket and swap it in, so get_by_attribute()/find_by()
+    iterate a bucket no one mutates, also without a lock. Sorted indexes
+    shift in place, so range() and find_in_ranges() take the structure
+    lock briefly. Writers lock the object's stripe (one of `stripes`
+    locks picked by id), so updates to different objects validate in
+    parallel; only the short storage and index changes share one lock.
+    """
+
+    def __init__(self, indexes=(), unique=(), ranges=(), stripes=16):
+        super().__init__(indexes=indexes, unique=unique, ranges=ranges)
+        self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._snapshot = ()
+
+    def _stripe(self, obj_id):
+        return self._stripes[hash(obj_id) % len(self._stripes)]
+
+    # a write copies the bucket it changes (O(bucket size), one entry for
+    # a unique attribute) so readers never see one change size mid-iteration
+    def _bucket_add(self, index, value, obj):
+        holders = dict(index.get(value, ()))
+        holders[obj.id] = obj
+        index[value] = holders
+
+    def _bucket_remove(self, index, value, obj_id):
+        holders = {key: obj for key, obj in index[value].items() if key != obj_id}
+        if holders:
+            index[value] = holders
+        else:
+            del index[value]
+
+    def _values(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._storage.values())
+        return snapshot
+
+    def add(self, obj):
+        with self._stripe(obj.id), self._lock:
+            super().add(obj)
+            self._snapshot = None
+
+    def get_all(self):
+        return list(self._values())
+
+    def update(self, obj_id, data):
+        with self._stripe(obj_id):
+            obj = self._storage.get(obj_id)
+            if obj:
+                obj.update(data)
+                if self._indexed_attrs:
+                    with self._lock:
+                        self._reindex(obj)
+                self._notify('update', obj)
+
+    def delete(self, obj_id):
+        with self._stripe(obj_id), self._lock:
+            super().delete(obj_id)
+            self._snapshot = None
+
+    # sorted indexes shift on every insert, so range reads take the
+    # structure lock for the bisect and slice
+    def range(self, attr_name, lo=None, hi=None):
+        with self._lock:
+            return super().range(attr_name, lo, hi)
+
+    def find_in_ranges(self, **bounds):
+        with self._lock:
+            return super().find_in_ranges(**bounds)
@@ -1,11 +1,51 @@
-from app.persistence.repository import InMemoryRepository
+from app.persistence import columnar
+from app.persistence.durable import DurableStore
+from app.persistence.repository import ConcurrentInMemoryRepository
 
 class HBnBFacade:
-    def __init__(self):
-        self.user_repo = InMemoryRepository()
-        self.place_repo = InMemoryRepository()
-        self.review_repo = InMemoryRepository()
-        self.amenity_repo = InMemoryRepository()
+    def __init__(self, data_dir=None):
+        # With a data_dir the repositories are logged and snapshotted there
+        # and reloaded on the next start; without one they live in memory only
+        self.store = DurableStore(data_dir) if data_dir else None
+        self.user_repo = self._repository('users', unique=('email',))
+        self.place_repo = self._repository('places', indexes=('owner',),
+                                          ranges=('price', 'latitude', 'longitude'))
+        self.review_repo = self._repository('reviews', indexes=('place', 'user'))
+        self.amenity_repo = self._repository('amenities')
+        # Vectorized place search when numpy is installed
+        self.place_columns = None
+        if columnar.np is not None:
+            self.place_columns = columnar.PlaceColumns()
+            self.place_repo.subscribe(self.place_columns.on_place)
+            self.review_repo.subscribe(self.place_columns.on_review)
+        if self.store:
+            self.store.open()
+
+    def _repository(self, name, **options):
+        if self.store is None:
+            return ConcurrentInMemoryRepository(**options)
+        return self.store.repository(name, **options)
+
+    def search_places(self, price=None, latitude=None, longitude=None, min_rating=None):
+        """
+        Places inside the given (lo, hi) ranges whose average review rating
+        is at least min_rating (when given).
+        """
+        if self.place_columns is not None:
+            ids = self.place_columns.search(price, latitude, longitude, min_rating)
+            return [place for place in map(self.place_repo.get, ids) if place]
+
+        bounds = {name: value for name, value in
+                  (('price', price), ('latitude', latitude), ('longitude', longitude)) if value}
+        places = self.place_repo.find_in_ranges(**bounds)
+        if min_rating is None:
+            return places
+        matches = []
+        for place in places:
+            ratings = [review.rating for review in self.review_repo.find_by('place', place)]
+            if ratings and sum(ratings) / len(ratings) >= min_rating:
+                matches.append(place)
+        return matches
 
     # Placeholder method for creating a user
     def create_user(self, user_data):
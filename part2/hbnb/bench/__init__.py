@@ -0,0 +1,5 @@
+"""
+Benchmarks for the in-memory backend, run from part2/hbnb as modules:
+
+    python -m bench.<name> --help
+"""
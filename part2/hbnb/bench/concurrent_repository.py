@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""
+Read/write throughput of ConcurrentInMemoryRepository's lock-free index
+reads against index reads under the structure lock.
+
+Reader threads mix get(), get_by_attribute('email') and
+find_by('owner_id'); writer threads move objects between owners (an
+indexed attribute). "locked reads" wraps the index reads in the
+repository's structure lock, as the class did before its buckets became
+copy-on-write; "lock-free reads" is the current class.
+
+    python -m bench.concurrent_repository --objects 100000 --seconds 3
+"""
+
+import argparse
+import random
+import threading
+import time
+from app.persistence.repository import ConcurrentInMemoryRepository
+
+OWNERS = 1000
+
+
+class Item:
+    __slots__ = ('id', 'email', 'owner_id')
+
+    def __init__(self, n):
+        self.id = f'item-{n}'
+        self.email = f'user{n}@bench.test'
+        self.owner_id = f'owner-{n % OWNERS}'
+
+    def update(self, data):
+        for key, value in data.items():
+            setattr(self, key, value)
+
+
+class LockedReadsRepository(ConcurrentInMemoryRepository):
+    """Index reads under the structure lock, the pre-copy-on-write behavior."""
+
+    def get_by_attribute(self, attr_name, attr_value):
+        with self._lock:
+            return super().get_by_attribute(attr_name, attr_value)
+
+    def find_by(self, attr_name, attr_value):
+        with self._lock:
+            return super().find_by(attr_name, attr_value)
+
+
+def run(repo_class, objects, readers, writers, seconds):
+    """(reads/s, writes/s) for one repository class."""
+    repo = repo_class(unique=('email',), indexes=('owner_id',))
+    for n in range(objects):
+        repo.add(Item(n))
+    counts = {'read': 0, 'write': 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        done = 0
+        while not stop.is_set():
+            n = rng.randrange(objects)
+            repo.get(f'item-{n}')
+            repo.get_by_attribute('email', f'user{n}@bench.test')
+            repo.find_by('owner_id', f'owner-{n % OWNERS}')
+            done += 3
+        with lock:
+            counts['read'] += done
+
+    def writer(seed):
+        rng = random.Random(seed)
+        done = 0
+        while not stop.is_set():
+            repo.update(f'item-{rng.randrange(objects)}', {'owner_id': f'owner-{rng.randrange(OWNERS)}'})
+            done += 1
+        with lock:
+            counts['write'] += done
+
+    threads = ([threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+               + [threading.Thread(target=writer, args=(-n - 1,)) for n in range(writers)])
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return counts['read'] / elapsed, counts['write'] / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--objects', type=int, default=100_000)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--readers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{args.objects:,} objects, {args.writers} writers, {args.seconds:g}s per run")
+    print(f"{'readers':<9}{'repository':<17}{'reads/s':>11}{'writes/s':>11}")
+    for readers in args.readers:
+        for name, repo_class in (('locked reads', LockedReadsRepository),
+                                 ('lock-free reads', ConcurrentInMemoryRepository)):
+            reads, writes = run(repo_class, args.objects, readers, args.writers, args.seconds)
+            print(f"{readers:<9}{name:<17}{reads:>11,.0f}{writes:>11,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""
+get_by_attribute/find_by on InMemoryRepository: linear scan against the
+hash indexes, at a million objects.
+
+The same objects go into a repository with no indexes (every lookup scans
+the storage dict) and one built with unique=('email',) and
+indexes=('owner_id',). part3 and part4 carry the same InMemoryRepository;
+--root points the benchmark at one of them instead of part2:
+
+    python -m bench.in_memory_indexes --objects 1000000
+    python -m bench.in_memory_indexes --root ../../part4/Back
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+OWNERS = 1000  # so find_by(owner_id) returns objects / OWNERS matches
+
+
+class Item:
+    __slots__ = ('id', 'email', 'owner_id')
+
+    def __init__(self, n):
+        self.id = f'item-{n}'
+        self.email = f'user{n}@bench.test'
+        self.owner_id = f'owner-{n % OWNERS}'
+
+
+def timed(calls, lookup):
+    """Mean seconds per call of lookup(n) over n in range(calls)."""
+    start = time.perf_counter()
+    for n in range(calls):
+        lookup(n)
+    return (time.perf_counter() - start) / calls
+
+
+def fill(repo, items):
+    start = time.perf_counter()
+    for item in items:
+        repo.add(item)
+    return (time.perf_counter() - start) / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--objects', type=int, default=1_000_000)
+    parser.add_argument('--scan-calls', type=int, default=20,
+                        help='lookups timed on the unindexed repository')
+    parser.add_argument('--index-calls', type=int, default=100_000,
+                        help='lookups timed on the indexed repository')
+    parser.add_argument('--root', help='project root whose app package to load (default: part2/hbnb)')
+    args = parser.parse_args()
+
+    if args.root:
+        sys.path.insert(0, os.path.abspath(args.root))
+    from app.persistence.repository import InMemoryRepository
+
+    items = [Item(n) for n in range(args.objects)]
+    scan = InMemoryRepository()
+    indexed = InMemoryRepository(unique=('email',), indexes=('owner_id',))
+    add_scan = fill(scan, items)
+    add_indexed = fill(indexed, items)
+
+    rng = random.Random(0)
+    emails = [items[rng.randrange(len(items))].email for _ in range(max(args.scan_calls, args.index_calls))]
+    owners = [f'owner-{rng.randrange(OWNERS)}' for _ in range(len(emails))]
+    index_calls = min(args.index_calls, 1000)  # find_by copies ~objects/OWNERS matches
+
+    rows = (
+        ('add()', add_scan, add_indexed),
+        ('get_by_attribute(email)',
+         timed(args.scan_calls, lambda n: scan.get_by_attribute('email', emails[n])),
+         timed(args.index_calls, lambda n: indexed.get_by_attribute('email', emails[n]))),
+        (f'find_by(owner_id), {args.objects // OWNERS} hits',
+         timed(args.scan_calls, lambda n: scan.find_by('owner_id', owners[n])),
+         timed(index_calls, lambda n: indexed.find_by('owner_id', owners[n]))),
+    )
+    print(f"{sys.modules['app'].__path__[0]}, {args.objects:,} objects")
+    print(f"{'operation':<32}{'scan':>12}{'indexed':>12}{'speedup':>13}")
+    for name, slow, fast in rows:
+        print(f"{name:<32}{slow * 1e6:>10.1f}us{fast * 1e6:>10.1f}us{slow / fast:>12,.2f}x")
+
+
+if __name__ == '__main__':
+    main()
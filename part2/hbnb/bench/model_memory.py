@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""
+Bytes per entity of the part2 models, with __slots__ against the per-instance
+__dict__ layout they replaced, measured with tracemalloc.
+
+"after" is what building each entity through its constructor allocates,
+field values (id string, datetimes, names) included. "before" swaps the
+object itself for the __dict__ layout: the same attribute values set on an
+instance of a plain class (so CPython's key-sharing dicts apply, as they
+did for the models), with its own updated_at datetime as before the two
+timestamps were shared. Both layouts are measured on copies of the same
+entities, so only the container differs.
+
+    python -m bench.model_memory --entities 20000
+"""
+
+import argparse
+import gc
+import platform
+import tracemalloc
+from datetime import timedelta
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+
+def traced(build):
+    """(result of build(), bytes it left allocated)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def slot_names(cls):
+    return [name for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ())]
+
+
+def slots_copy(objs):
+    cls = type(objs[0])
+    names = slot_names(cls)
+    copies = []
+    for obj in objs:
+        copy = cls.__new__(cls)
+        for name in names:
+            setattr(copy, name, getattr(obj, name))
+        copies.append(copy)
+    return copies
+
+
+def dict_copy(objs):
+    cls = type(objs[0])
+    plain = type(f'{cls.__name__}Dict', (), {})
+    names = slot_names(cls)
+    copies = []
+    for obj in objs:
+        copy = plain()
+        for name in names:
+            setattr(copy, name, getattr(obj, name))
+        copy.updated_at = obj.updated_at + timedelta(0)  # a datetime of its own
+        copies.append(copy)
+    return copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entities', type=int, default=20000)
+    args = parser.parse_args()
+    n = args.entities
+
+    owner = User('Owner', 'Host', 'owner@bench.test')
+    guest = User('Guest', 'Visitor', 'guest@bench.test')
+    place = Place('Loft', 'Bright loft', 80.0, 10.0, 20.0, owner)
+    cases = (
+        ('User', lambda: [User(f'First{i}', f'Last{i}', f'user{i}@bench.test') for i in range(n)]),
+        ('Amenity', lambda: [Amenity(f'Amenity {i}') for i in range(n)]),
+        ('Place', lambda: [Place(f'Place {i}', 'A place', 50.0 + i % 100, 10.0, 20.0, owner)
+                           for i in range(n)]),
+        ('Review', lambda: [Review(f'Review {i}', 1 + i % 5, place, guest) for i in range(n)]),
+    )
+
+    print(f"Python {platform.python_version()}, {n:,} entities each")
+    print(f"{'model':<10}{'before':>9}{'after':>9}{'saved':>9}   bytes per entity")
+    for name, build in cases:
+        entities, after = traced(build)
+        _, slots = traced(lambda: slots_copy(entities))
+        _, dicts = traced(lambda: dict_copy(entities))
+        before = after - slots + dicts
+        print(f"{name:<10}{before / n:>9.0f}{after / n:>9.0f}{(before - after) / n:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Stress tests for ConcurrentInMemoryRepository.
+
+Writers keep moving objects between index buckets while readers hit the
+indexed lookups, the range index and the scans. Every read must succeed
+and return a consistent answer; any exception in a thread fails the test.
+"""
+
+import threading
+import time
+import unittest
+from app.models.user import User
+from app.persistence.repository import ConcurrentInMemoryRepository
+
+DURATION = 1.5  # seconds each stress test runs
+
+
+class _Item:
+    """Minimal entity with an update() like BaseModel's."""
+
+    def __init__(self, obj_id, group, score):
+        self.id = obj_id
+        self.group = group
+        self.score = score
+
+    def update(self, data):
+        for key, value in data.items():
+            setattr(self, key, value)
+
+
+def _run(workers, duration=DURATION):
+    """Runs each worker(stop) in its own thread and returns the errors they raised."""
+    stop = threading.Event()
+    errors = []
+
+    def guarded(worker):
+        try:
+            worker(stop)
+        except BaseException as e:  # StopIteration included
+            errors.append(e)
+            stop.set()
+
+    threads = [threading.Thread(target=guarded, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestConcurrentInMemoryRepository(unittest.TestCase):
+    def test_unique_lookups_while_email_toggles(self):
+        repo = ConcurrentInMemoryRepository(unique=('email',))
+        user = User("Ada", "Lovelace", "ada@example.com")
+        repo.add(user)
+        for i in range(50):
+            repo.add(User("Other", "User", f"user{i}@example.com"))
+        emails = ("ada@example.com", "countess@example.com")
+
+        def writer(stop):
+            i = 0
+            while not stop.is_set():
+                repo.update(user.id, {'email': emails[i % 2]})
+                i += 1
+
+        def reader(stop):
+            while not stop.is_set():
+                for email in emails:
+                    found = repo.get_by_attribute('email', email)
+                    self.assertIn(found, (user, None))
+                    self.assertIn(repo.find_by('email', email), ([user], []))
+                self.assertEqual(repo.get_by_attribute('email', 'user7@example.com').email,
+                                 'user7@example.com')
+
+        errors = _run([writer] + [reader] * 4)
+        self.assertEqual(errors, [])
+        self.assertIs(repo.get_by_attribute('email', user.email), user)
+
+    def test_indexed_and_range_reads_while_adding_and_deleting(self):
+        repo = ConcurrentInMemoryRepository(indexes=('group',), ranges=('score',))
+        stable = [_Item(f"stable-{i}", 'stable', i) for i in range(100)]
+        for item in stable:
+            repo.add(item)
+
+        def writer(prefix):
+            def write(stop):
+                i = 0
+                while not stop.is_set():
+                    item = _Item(f"{prefix}-{i}", i % 3, 1000 + i % 50)
+                    repo.add(item)
+                    repo.update(item.id, {'group': (i + 1) % 3, 'score': 2000})
+                    if i >= 20:
+                        repo.delete(f"{prefix}-{i - 20}")
+                    i += 1
+            return write
+
+        def reader(stop):
+            while not stop.is_set():
+                self.assertEqual(repo.find_by('group', 'stable'), stable)
+                self.assertEqual(repo.range('score', 0, 99), stable)
+                self.assertEqual(len(repo.find_in_ranges(score=(10, 19))), 10)
+                for group in range(3):
+                    for item in repo.find_by('group', group):
+                        self.assertTrue(item.id.startswith('churn-'))
+                    repo.get_by_attribute('group', group)
+                self.assertGreaterEqual(len(repo.get_all()), len(stable))
+
+        errors = _run([writer('churn-a'), writer('churn-b')] + [reader] * 4)
+        self.assertEqual(errors, [])
+
+    def test_unchanged_buckets_stay_whole_while_other_attributes_move(self):
+        # index reads take no lock: an update must only touch the buckets of
+        # the attributes it changes, never drop and re-add the others
+        repo = ConcurrentInMemoryRepository(indexes=('group', 'score'))
+        stable = [_Item(f"stable-{i}", 'stable', 0) for i in range(100)]
+        for item in stable:
+            repo.add(item)
+
+        def writer(stop):
+            i = 0
+            while not stop.is_set():
+                repo.update(stable[i % len(stable)].id, {'score': i % 7})
+                i += 1
+
+        def reader(stop):
+            while not stop.is_set():
+                self.assertEqual(repo.find_by('group', 'stable'), stable)
+                self.assertIn(repo.get_by_attribute('group', 'stable'), stable)
+                for score in range(7):
+                    for item in repo.find_by('score', score):
+                        self.assertTrue(item.id.startswith('stable-'))
+
+        errors = _run([writer] * 2 + [reader] * 4)
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,10 +28,52 @@ class Repository(ABC):
 
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    """
+    Dict-backed repository. Attributes listed in `indexes` (or `unique`, which
+    also rejects a second object with the same value) get a hash index, so
+    get_by_attribute()/find_by() on them are dict lookups instead of scans.
+    Change indexed attributes through update() so the indexes follow.
+    """
+
+    def __init__(self, indexes=(), unique=()):
         self._storage = {}
+        self._unique = frozenset(unique)
+        # attr -> value -> {obj_id: obj}, insertion ordered like _storage
+        self._indexes = {attr: {} for attr in dict.fromkeys((*unique, *indexes))}
+        # obj_id -> indexed values at the time it was (re)indexed
+        self._indexed_values = {}
+
+    def _index_values(self, obj):
+        return tuple(getattr(obj, attr, None) for attr in self._indexes)
+
+    def _check_unique(self, obj_id, values):
+        for attr, value in zip(self._indexes, values):
+            if attr in self._unique and value is not None:
+                holders = self._indexes[attr].get(value)
+                if holders and (len(holders) > 1 or obj_id not in holders):
+                    raise ValueError(f"{attr} '{value}' is already in use")
+
+    def _index(self, obj, values):
+        self._indexed_values[obj.id] = values
+        for attr, value in zip(self._indexes, values):
+            self._indexes[attr].setdefault(value, {})[obj.id] = obj
+
+    def _unindex(self, obj_id):
+        values = self._indexed_values.pop(obj_id, None)
+        if values is None:
+            return
+        for attr, value in zip(self._indexes, values):
+            holders = self._indexes[attr][value]
+            del holders[obj_id]
+            if not holders:
+                del self._indexes[attr][value]
 
     def add(self, obj):
+        if self._indexes:
+            values = self._index_values(obj)
+            self._check_unique(obj.id, values)
+            self._unindex(obj.id)
+            self._index(obj, values)
         self._storage[obj.id] = obj
 
     def get(self, obj_id):
@@ -43,15 +85,39 @@ class InMemoryRepository(Repository):
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
+            if not self._indexes:
+                obj.update(data)
+                return
+            old_values = self._indexed_values[obj_id]
             obj.update(data)
+            values = self._index_values(obj)
+            if values != old_values:
+                try:
+                    self._check_unique(obj_id, values)
+                except ValueError:
+                    for attr, value in zip(self._indexes, old_values):
+                        setattr(obj, attr, value)
+                    raise
+                self._unindex(obj_id)
+                self._index(obj, values)
 
     def delete(self, obj_id):
         if obj_id in self._storage:
             del self._storage[obj_id]
+            self._unindex(obj_id)
 
     def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes:
+            holders = self._indexes[attr_name].get(attr_value)
+            return next(iter(holders.values())) if holders else None
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
 
+    def find_by(self, attr_name, attr_value):
+        """All objects whose attribute equals the value, in insertion order."""
+        if attr_name in self._indexes:
+            return list(self._indexes[attr_name].get(attr_value, {}).values())
+        return [obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value]
+
 
 class SQLAlchemyRepository(Repository):
     def __init__(self, model):
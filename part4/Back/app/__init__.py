@@ -40,10 +40,16 @@ def create_app(config_class=None):
     app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False)
     app.config.setdefault("JWT_SECRET_KEY", app.config.get("SECRET_KEY", "dev-secret"))
     app.config.setdefault("PROPAGATE_EXCEPTIONS", True)
+    app.config.setdefault("SQLALCHEMY_REQUEST_UNIT_OF_WORK", True)
+    app.config.setdefault("REPOSITORY_CACHE", "memory")
+    app.config.setdefault("SQL_METRICS", False)
+    # statements slower than this (ms) are logged with their query plan; None disables
+    app.config.setdefault("SLOW_QUERY_THRESHOLD_MS", None)
 
     # Init optional extensions
     if CORS:
-        CORS(app)
+        # let the frontend read the pagination cursor on list responses
+        CORS(app, expose_headers=["X-Next-Cursor"])
     if bcrypt:
         bcrypt.init_app(app)
 
@@ -51,6 +57,15 @@ def create_app(config_class=None):
     db.init_app(app)
     jwt.init_app(app)
 
+    from app import metrics, slow_queries
+    from app.persistence import cache, engine, unit_of_work
+    engine.init_app(app)
+    slow_queries.init_app(app)
+    # before the unit of work so its end-of-request flush is counted
+    metrics.init_app(app)
+    unit_of_work.init_app(app)
+    cache.init_app(app)
+
     # API
     api = Api(
         app,
@@ -76,6 +91,8 @@ def create_app(config_class=None):
     # DB setup + admin user
     with app.app_context():
         db.create_all()
+        from app.persistence.migrations import ensure_indexes
+        ensure_indexes()
         try:
             from app.services import facade
             admin = facade.get_user_by_email("admin@hbnb.com")
@@ -2,6 +2,7 @@
 
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.pagination import pagination_parser, page_headers, NEXT_CURSOR_HEADER
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -25,11 +26,18 @@ class AmenityList(Resource):
 
         return {'id': amenity.id, 'name': amenity.name}, 201
 
-    @api.response(200, 'List of amenities retrieved successfully')
+    @api.expect(pagination_parser)
+    @api.response(200, 'List of amenities retrieved successfully',
+                  headers={NEXT_CURSOR_HEADER: 'Cursor for the next page, absent on the last page'})
+    @api.response(400, 'Invalid cursor or limit')
     def get(self):
-        """Retrieve a list of all amenities"""
-        amenities = facade.get_all_amenities()
-        return [{'id': a.id, 'name': a.name} for a in amenities], 200
+        """Retrieve a page of amenities"""
+        args = pagination_parser.parse_args()
+        try:
+            amenities, next_cursor = facade.get_all_amenities(after=args['cursor'], limit=args['limit'])
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return [{'id': a.id, 'name': a.name} for a in amenities], 200, page_headers(next_cursor)
 
 @api.route('/<amenity_id>')
 class AmenityResource(Resource):
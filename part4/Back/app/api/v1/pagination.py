@@ -0,0 +1,18 @@
+#!/usr/bin/python3
+"""Query parsing shared by the cursor-paginated list endpoints."""
+
+from flask_restx import reqparse
+from app.persistence.repository import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+pagination_parser = reqparse.RequestParser()
+pagination_parser.add_argument('cursor', type=str, location='args',
+                               help='Opaque next_cursor returned by the previous page')
+pagination_parser.add_argument('limit', type=int, location='args', default=DEFAULT_PAGE_SIZE,
+                               help=f'Page size (at most {MAX_PAGE_SIZE})')
+
+
+def page_headers(next_cursor):
+    """Response headers advertising the next page, if there is one."""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
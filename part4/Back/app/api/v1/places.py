@@ -4,9 +4,13 @@
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services import facade
+from app.api.v1.pagination import pagination_parser, page_headers, NEXT_CURSOR_HEADER
 
 api = Namespace('places', description='Place operations')
 
+# newest reviews embedded in the place details; more via /reviews/place/<id>
+PLACE_DETAIL_REVIEWS = 10
+
 amenity_model = api.model('PlaceAmenity', {
     'id': fields.String(description='Amenity ID'),
     'name': fields.String(description='Name of the amenity')
@@ -65,18 +69,26 @@ class PlaceList(Resource):
             "owner_id": place.owner.id
         }, 201
 
-    @api.response(200, 'List of places retrieved successfully')
+    @api.expect(pagination_parser)
+    @api.response(200, 'List of places retrieved successfully',
+                  headers={NEXT_CURSOR_HEADER: 'Cursor for the next page, absent on the last page'})
+    @api.response(400, 'Invalid cursor or limit')
     def get(self):
-        """Retrieve a list of all places"""
-        return facade.get_all_places(), 200
+        """Retrieve a page of places"""
+        args = pagination_parser.parse_args()
+        try:
+            places, next_cursor = facade.get_all_places(after=args['cursor'], limit=args['limit'])
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return places, 200, page_headers(next_cursor)
 
 @api.route('/<place_id>')
 class PlaceResource(Resource):
     @api.response(200, 'Place details retrieved successfully')
     @api.response(404, 'Place not found')
     def get(self, place_id):
-        """Get place details by ID"""
-        place = facade.get_place(place_id)
+        """Get place details by ID, with its newest reviews"""
+        place = facade.get_place(place_id, reviews=PLACE_DETAIL_REVIEWS)
         if not place:
             return {'error': 'Place not found'}, 404
         return place, 200
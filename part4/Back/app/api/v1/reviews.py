@@ -3,8 +3,9 @@
 """Review API endpoints using Flask-RESTx."""
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from app.services.facade import HBnBFacade
+from app.services.facade import HBnBFacade, REVIEW_SORTS
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from app.api.v1.pagination import pagination_parser, page_headers, NEXT_CURSOR_HEADER
 
 
 # Define the namespace for reviews
@@ -27,14 +28,27 @@ review_output = reviews_ns.model('ReviewOutput', {
     'place_id': fields.String
 })
 
+# Query arguments of the reviews of one place: a page plus its sort
+place_reviews_parser = pagination_parser.copy()
+place_reviews_parser.add_argument('sort', type=str, location='args', default='newest',
+                                  choices=tuple(REVIEW_SORTS),
+                                  help='newest first, or highest rating first')
+
 facade = HBnBFacade()
 
 @reviews_ns.route('/')
 class ReviewList(Resource):
+    @reviews_ns.expect(pagination_parser)
+    @reviews_ns.header(NEXT_CURSOR_HEADER, 'Cursor for the next page, absent on the last page')
     @reviews_ns.marshal_list_with(review_output)
     def get(self):
-        """Get all reviews"""
-        return facade.get_all_reviews()
+        """Get a page of reviews"""
+        args = pagination_parser.parse_args()
+        try:
+            reviews, next_cursor = facade.get_all_reviews(after=args['cursor'], limit=args['limit'])
+        except ValueError as e:
+            reviews_ns.abort(400, str(e))
+        return reviews, 200, page_headers(next_cursor)
 
     @reviews_ns.expect(review_input)
     @reviews_ns.marshal_with(review_output, code=201)
@@ -55,8 +69,7 @@ class ReviewList(Resource):
             return {"error": "You cannot review your own place."}, 400
 
         # Step 3: Check for existing review by this user for this place
-        existing_review = facade.get_review_by_user_and_place(current_user_id, data['place_id'])
-        if existing_review:
+        if facade.has_reviewed(current_user_id, data['place_id']):
             return {"error": "You have already reviewed this place."}, 400
 
         # Step 4: Create the review
@@ -131,13 +144,21 @@ class ReviewResource(Resource):
 @reviews_ns.route('/place/<string:place_id>')
 @reviews_ns.param('place_id', 'The place identifier')
 class PlaceReviews(Resource):
+    @reviews_ns.expect(place_reviews_parser)
+    @reviews_ns.header(NEXT_CURSOR_HEADER, 'Cursor for the next page, absent on the last page')
     @reviews_ns.marshal_list_with(review_output)
     def get(self, place_id):
-        """Get all reviews for a specific place"""
-        reviews = facade.get_reviews_by_place(place_id)
-        if reviews is None:
+        """Get a page of reviews for a specific place"""
+        args = place_reviews_parser.parse_args()
+        try:
+            page = facade.get_reviews_by_place(place_id, after=args['cursor'],
+                                               limit=args['limit'], sort=args['sort'])
+        except ValueError as e:
+            reviews_ns.abort(400, str(e))
+        if page is None:
             reviews_ns.abort(404, "Place not found")
-        return reviews
+        reviews, next_cursor = page
+        return reviews, 200, page_headers(next_cursor)
 
 @reviews_ns.route('/place/<string:place_id>/new')
 @reviews_ns.param('place_id', 'The place identifier')
@@ -164,8 +185,7 @@ class ReviewToPlace(Resource):
             return {"error": "You cannot review your own place."}, 400
 
         # Check for duplicates
-        existing_review = facade.get_review_by_user_and_place(current_user_id, place_id)
-        if existing_review:
+        if facade.has_reviewed(current_user_id, place_id):
             return {"error": "You have already reviewed this place."}, 400
 
         # Set the place_id now that it's validated
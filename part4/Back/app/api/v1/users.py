@@ -2,6 +2,7 @@
 
 from flask_restx import Namespace, Resource, fields
 from app.services import facade
+from app.api.v1.pagination import pagination_parser, page_headers, NEXT_CURSOR_HEADER
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 
 api = Namespace('users', description='User operations')
@@ -28,7 +29,7 @@ class UserList(Resource):
         if not claims.get("is_admin", False):
             return {"error": "Admin privileges required"}, 403
 
-        if facade.get_user_by_email(user_data['email']):
+        if facade.email_taken(user_data['email']):
             return {'error': 'Email already registered'}, 400
 
         try:
@@ -43,9 +44,17 @@ class UserList(Resource):
             'email': new_user.email
         }, 201
 
+    @api.expect(pagination_parser)
+    @api.response(200, 'List of users retrieved successfully',
+                  headers={NEXT_CURSOR_HEADER: 'Cursor for the next page, absent on the last page'})
+    @api.response(400, 'Invalid cursor or limit')
     def get(self):
-        """Get list of all users"""
-        users = facade.get_all_users()
+        """Get a page of users"""
+        args = pagination_parser.parse_args()
+        try:
+            users, next_cursor = facade.get_all_users(after=args['cursor'], limit=args['limit'])
+        except ValueError as e:
+            return {'error': str(e)}, 400
         result = []
         for user in users:
             result.append({
@@ -54,7 +63,7 @@ class UserList(Resource):
                 'last_name': user.last_name,
                 'email': user.email
             })
-        return result, 200
+        return result, 200, page_headers(next_cursor)
     
 @api.route('/<user_id>')
 class UserResource(Resource):
@@ -89,10 +98,8 @@ class UserResource(Resource):
         else:
             # If admin is updating email, ensure uniqueness
             new_email = user_data.get("email")
-            if new_email:
-                existing_user = facade.get_user_by_email(new_email)
-                if existing_user and existing_user.id != user_id:
-                    return {"error": "Email already in use"}, 400
+            if new_email and facade.email_taken(new_email, exclude_user_id=user_id):
+                return {"error": "Email already in use"}, 400
 
         try:
             updated_user = facade.update_user(user_id, user_data)
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+"""
+Per-request SQL instrumentation.
+
+Counts the statements each request sends to the database and the time spent
+in them, returns both as response headers in debug mode and aggregates them
+per endpoint at /metrics in Prometheus text format. Counters are per process;
+with several workers, scrape each one or sum them. With SQL_METRICS_TOKEN set,
+/metrics answers only requests carrying "Authorization: Bearer <token>".
+"""
+
+import hmac
+import threading
+import time
+from flask import Response, abort, g, has_request_context, request
+from sqlalchemy import event
+from app import db
+
+QUERY_COUNT_HEADER = 'X-SQL-Query-Count'
+QUERY_TIME_HEADER = 'X-SQL-Query-Time-ms'
+# attribute set on the statement's ExecutionContext: it goes away with the
+# statement, so one that fails (no after_cursor_execute) leaves nothing behind
+START_ATTRIBUTE = '_hbnb_query_start'
+
+
+class EndpointStats:
+    """Thread-safe running totals keyed by (method, endpoint)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {}
+
+    def observe(self, method, endpoint, queries, seconds):
+        with self._lock:
+            totals = self._totals.setdefault((method, endpoint), [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += queries
+            totals[2] += seconds
+
+    def snapshot(self):
+        with self._lock:
+            return {key: tuple(totals) for key, totals in self._totals.items()}
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(stats, cache_stats=None):
+    """Formats the collected totals in the Prometheus text exposition format."""
+    snapshot = sorted(stats.snapshot().items())
+    families = (
+        ('hbnb_http_requests_total', 'Requests served.', 0),
+        ('hbnb_db_queries_total', 'SQL statements executed while serving requests.', 1),
+        ('hbnb_db_query_seconds_total', 'Time spent executing SQL while serving requests.', 2),
+    )
+    lines = []
+    for name, help_text, index in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for (method, endpoint), totals in snapshot:
+            labels = f'method="{_label(method)}",endpoint="{_label(endpoint)}"'
+            lines.append(f"{name}{{{labels}}} {totals[index]}")
+    if cache_stats:
+        for key in ('hits', 'misses'):
+            name = f"hbnb_repository_cache_{key}_total"
+            lines.append(f"# HELP {name} Repository cache {key}.")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {cache_stats[key]}")
+    return '\n'.join(lines) + '\n'
+
+
+def init_app(app):
+    """
+    Hooks cursor execution on the app's engine and registers the request
+    hooks and the metrics endpoint (SQL_METRICS_ENDPOINT, default /metrics).
+    Call it before other after_request hooks that still run SQL (like the
+    unit of work commit) so their statements are counted too.
+    """
+    if not app.config.get('SQL_METRICS'):
+        return
+    stats = EndpointStats()
+    app.extensions['hbnb_sql_metrics'] = stats
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            setattr(context, START_ATTRIBUTE, time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, START_ATTRIBUTE, None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        if has_request_context() and 'sql_query_count' in g:
+            g.sql_query_count += 1
+            g.sql_query_time += elapsed
+
+    @app.before_request
+    def _reset_query_counters():
+        g.sql_query_count = 0
+        g.sql_query_time = 0.0
+
+    @app.after_request
+    def _record_query_counters(response):
+        if 'sql_query_count' not in g:
+            return response
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        stats.observe(request.method, endpoint, g.sql_query_count, g.sql_query_time)
+        if app.debug:
+            response.headers[QUERY_COUNT_HEADER] = str(g.sql_query_count)
+            response.headers[QUERY_TIME_HEADER] = f"{g.sql_query_time * 1000:.2f}"
+        return response
+
+    token = app.config.get('SQL_METRICS_TOKEN')
+
+    def metrics():
+        if token and not hmac.compare_digest(request.headers.get('Authorization', ''),
+                                             f"Bearer {token}"):
+            abort(401)
+        from app.persistence.cache import get_cache
+        cache = get_cache()
+        body = render_prometheus(stats, cache.stats() if cache else None)
+        return Response(body, mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule(app.config.get('SQL_METRICS_ENDPOINT', '/metrics'), 'metrics', metrics)
@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 from app import db
+from app.persistence.unit_of_work import commit
 import uuid #generates universally unique ID
 from datetime import datetime, timezone #gives access to current time for created or update
 
@@ -11,11 +12,21 @@ class BaseModel(db.Model): #defined all other models will inherit from
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc),
                            onupdate=lambda: datetime.now(timezone.utc))
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # fill client-side defaults now so the id is usable before the unit of work flushes
+        if self.id is None:
+            self.id = str(uuid.uuid4())
+        if self.created_at is None:
+            self.created_at = datetime.now(timezone.utc)
+        if self.updated_at is None:
+            self.updated_at = self.created_at
         
     def save(self):
         """Update the updated_at timestamp to the current time."""
         self.updated_at = datetime.now(timezone.utc) #method updates when obj is changed or saved
-        db.session.commit()
+        commit() # deferred to the end of the unit of work when one is open
         
     def update(self, data): #method updates bj attributes using dict.
         for key, value in data.items(): #loop so we apply multi updates at once
@@ -11,6 +11,11 @@ place_amenity = db.Table('place_amenity',
 
 class Place(BaseModel):
     __tablename__ = 'places'
+    __table_args__ = (
+        db.Index('idx_places_owner_id', 'owner_id'),
+        db.Index('idx_places_price', 'price'),
+        db.Index('idx_places_location', 'latitude', 'longitude'),
+    )
 
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, default="")
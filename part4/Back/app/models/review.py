@@ -9,6 +9,15 @@ class Review(BaseModel):
     """Defines a Review left by a User on a Place"""
 
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # one review per user and place; also serves lookups by user_id
+        db.Index('uq_reviews_user_place', 'user_id', 'place_id', unique=True),
+        # keyset pages of a place's reviews, newest or best rated first:
+        # the sort key and the id tie-breaker are in the index, so a page
+        # is read in order without sorting (also serves place_id lookups)
+        db.Index('idx_reviews_place_created_id', 'place_id', 'created_at', 'id'),
+        db.Index('idx_reviews_place_rating_id', 'place_id', 'rating', 'id'),
+    )
 
     text = db.Column(db.Text, nullable=False)
     rating = db.Column(db.Integer, nullable=False)
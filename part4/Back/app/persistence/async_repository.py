@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+"""
+Async counterpart of SQLAlchemyRepository on SQLAlchemy asyncio.
+
+Meant for serving endpoints from an asyncio server: queries await the
+database instead of blocking a worker thread. Needs the optional async
+driver for the database (aiosqlite for SQLite).
+Every call runs in its own short AsyncSession and commits on its own (there
+is no unit of work); returned objects are detached, so relationships must
+be loaded up front through `options`. Writes made here do not go through
+the Flask app's repository cache.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import lazyload
+from app.persistence.engine import set_sqlite_pragmas
+from app.persistence.repository import (
+    BULK_CHUNK_SIZE, DEFAULT_PAGE_SIZE, SQLAlchemyRepository, finish_page, page_statement,
+    where_clause)
+
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+}
+
+
+def async_session_factory(sync_url, sqlite_pragmas=None, **engine_options):
+    """
+    Builds an async_sessionmaker for the database behind a sync SQLAlchemy
+    URL (e.g. db.engine.url), swapping in the matching async driver.
+    sqlite_pragmas run on each new connection, like SQLITE_PRAGMAS on the
+    Flask engine.
+    """
+    url = sync_url.set(drivername=ASYNC_DRIVERS.get(sync_url.get_backend_name(), sync_url.drivername))
+    engine = create_async_engine(url, **engine_options)
+    set_sqlite_pragmas(engine.sync_engine, sqlite_pragmas)
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class AsyncSQLAlchemyRepository:
+    """Same methods as Repository, as coroutines (iter_all is an async generator)."""
+
+    def __init__(self, model, session_factory):
+        self.model = model
+        self.session_factory = session_factory
+        # session-free helpers shared with the sync repository (_row, _validated)
+        self._sync = SQLAlchemyRepository(model)
+
+    async def add(self, obj):
+        async with self.session_factory() as session:
+            session.add(obj)
+            await session.commit()
+
+    async def get(self, obj_id, options=()):
+        async with self.session_factory() as session:
+            return await session.get(self.model, obj_id, options=options)
+
+    async def get_many(self, obj_ids, chunk_size=BULK_CHUNK_SIZE, options=()):
+        obj_ids = list(dict.fromkeys(obj_ids))
+        by_id = {}
+        async with self.session_factory() as session:
+            for start in range(0, len(obj_ids), chunk_size):
+                chunk = obj_ids[start:start + chunk_size]
+                stmt = select(self.model).where(self.model.id.in_(chunk)).options(*options)
+                for obj in (await session.execute(stmt)).scalars():
+                    by_id[obj.id] = obj
+        found = [by_id[obj_id] for obj_id in obj_ids if obj_id in by_id]
+        missing = [obj_id for obj_id in obj_ids if obj_id not in by_id]
+        return found, missing
+
+    async def get_all(self):
+        async with self.session_factory() as session:
+            return (await session.execute(select(self.model))).scalars().all()
+
+    async def iter_all(self, chunk_size=BULK_CHUNK_SIZE, options=()):
+        """Streams the table chunk by chunk (async generator)."""
+        stmt = select(self.model).options(lazyload('*'), *options)
+        async with self.session_factory() as session:
+            result = await session.stream(stmt.execution_options(yield_per=chunk_size))
+            async for obj in result.scalars():
+                yield obj
+
+    async def update(self, obj_id, data):
+        async with self.session_factory() as session:
+            obj = await session.get(self.model, obj_id)
+            if obj:
+                for key, value in data.items():
+                    setattr(obj, key, value)
+                await session.commit()
+
+    async def delete(self, obj_id):
+        async with self.session_factory() as session:
+            result = await session.execute(delete(self.model).where(self.model.id == obj_id))
+            await session.commit()
+            return result.rowcount
+
+    async def get_by_attribute(self, attr_name, attr_value):
+        stmt = select(self.model).filter_by(**{attr_name: attr_value}).limit(1)
+        async with self.session_factory() as session:
+            return (await session.execute(stmt)).scalars().first()
+
+    async def exists(self, **filters):
+        stmt = select(select(self.model.id).where(where_clause(self.model, filters)).exists())
+        async with self.session_factory() as session:
+            return (await session.execute(stmt)).scalar()
+
+    async def select_where(self, filters, columns):
+        unknown = [name for name in columns if name not in self.model.__table__.columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        stmt = (select(*(getattr(self.model, name) for name in columns))
+                .where(where_clause(self.model, filters)))
+        async with self.session_factory() as session:
+            return (await session.execute(stmt)).all()
+
+    async def add_many(self, objs, chunk_size=BULK_CHUNK_SIZE):
+        """Executemany INSERT and commit per chunk, see SQLAlchemyRepository.add_many()."""
+        objs = list(objs)
+        async with self.session_factory() as session:
+            for start in range(0, len(objs), chunk_size):
+                rows = [self._sync._row(obj) for obj in objs[start:start + chunk_size]]
+                await session.execute(insert(self.model.__table__), rows)
+                await session.commit()
+        return len(objs)
+
+    async def update_many(self, updates, chunk_size=BULK_CHUNK_SIZE):
+        """Executemany UPDATE by id per chunk, see SQLAlchemyRepository.update_many()."""
+        table = self.model.__table__
+        items = list(updates.items())
+        count = 0
+        async with self.session_factory() as session:
+            for start in range(0, len(items), chunk_size):
+                now = datetime.now(timezone.utc)
+                groups = {}
+                for obj_id, data in items[start:start + chunk_size]:
+                    values = dict(data)
+                    if 'updated_at' in table.columns:
+                        values['updated_at'] = now
+                    groups.setdefault(tuple(sorted(values)), []).append(
+                        dict(values, _obj_id=obj_id))
+                for keys, rows in groups.items():
+                    stmt = (update(table)
+                            .where(table.c.id == bindparam('_obj_id'))
+                            .values({key: bindparam(key) for key in keys}))
+                    count += (await session.execute(stmt, rows)).rowcount
+                await session.commit()
+        return count
+
+    async def delete_many(self, obj_ids, chunk_size=BULK_CHUNK_SIZE):
+        obj_ids = list(obj_ids)
+        count = 0
+        async with self.session_factory() as session:
+            for start in range(0, len(obj_ids), chunk_size):
+                chunk = obj_ids[start:start + chunk_size]
+                result = await session.execute(
+                    delete(self.model.__table__).where(self.model.__table__.c.id.in_(chunk)))
+                count += result.rowcount
+                await session.commit()
+        return count
+
+    async def update_where(self, filters, values, validate=False):
+        if validate:
+            values = self._sync._validated(values)
+        stmt = (update(self.model.__table__)
+                .where(where_clause(self.model, filters)).values(**values))
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount
+
+    async def delete_where(self, filters):
+        stmt = delete(self.model.__table__).where(where_clause(self.model, filters))
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount
+
+    async def get_page(self, after=None, limit=DEFAULT_PAGE_SIZE, order_by='id', columns=None, options=(),
+                       filters=None):
+        """Keyset pagination, see SQLAlchemyRepository.get_page()."""
+        stmt, limit = page_statement(self.model, after, limit, order_by, columns, filters)
+        if options and not columns:
+            stmt = stmt.options(*options)
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            rows = result.all() if columns else result.scalars().all()
+        return finish_page(rows, limit, order_by)
@@ -0,0 +1,246 @@
+#!/usr/bin/python3
+"""
+Read-through cache for SQLAlchemyRepository.get().
+
+Entries are the column values of a row (not ORM instances, which are bound
+to one session), keyed by "<table>:<id>". Writes through the repository and
+any ORM flush touching a cached model invalidate the matching keys, and
+again when the transaction commits or rolls back: until then another
+session may still read (and cache) the old row. A session holding such
+uncommitted writes does not fill the cache either, so nothing it read
+from its own transaction outlives a rollback.
+
+The same backend holds serialized views built from several rows (e.g. a
+place with its owner and amenities). Those are keyed by "<kind>:<id>" of
+their main row, dropped with it (DERIVED_KINDS), and stamped with the
+table_generation() of every table they read, their own included, so a
+write racing with the build leaves the entry stale.
+"""
+
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Optional dependency (shared cache across workers)
+try:
+    import redis
+except ImportError:
+    redis = None
+
+EXTENSION_KEY = 'hbnb_repository_cache'
+# session.info key: table -> ids written in the open transaction
+PENDING_KEY = 'hbnb_cache_pending'
+# pending "table" standing for writes whose rows are unknown: clear everything
+ALL_TABLES = '*'
+
+# table -> kinds of serialized views keyed by the id of one of its rows
+DERIVED_KINDS = {
+    'places': ('place_detail',),
+}
+
+
+def cache_key(table_name, obj_id):
+    return f"{table_name}:{obj_id}"
+
+
+def generation_key(table_name):
+    return f"generation:{table_name}"
+
+
+def table_generation(cache, table_name):
+    """
+    Opaque token that changes whenever a row of the table is invalidated.
+    A lost token (evicted or expired) is replaced by a fresh one, so views
+    stamped before the loss never validate again.
+    """
+    key = generation_key(table_name)
+    token = cache.get(key)
+    if token is None:
+        token = uuid.uuid4().hex
+        cache.set(key, token)
+    return token
+
+
+def invalidate(cache, table_name, obj_ids):
+    """Drops the cached rows and their derived views and moves the table generation on."""
+    for obj_id in obj_ids:
+        cache.delete(cache_key(table_name, obj_id))
+        for kind in DERIVED_KINDS.get(table_name, ()):
+            cache.delete(cache_key(kind, obj_id))
+    cache.set(generation_key(table_name), uuid.uuid4().hex)
+
+
+def invalidate_pending(session, cache, table_name, obj_ids):
+    """invalidate() now, and once more when the session's transaction ends."""
+    invalidate(cache, table_name, obj_ids)
+    session.info.setdefault(PENDING_KEY, {}).setdefault(table_name, set()).update(obj_ids)
+
+
+def clear_pending(session, cache):
+    """cache.clear() now, and once more when the session's transaction ends."""
+    cache.clear()
+    session.info.setdefault(PENDING_KEY, {})[ALL_TABLES] = set()
+
+
+def pending_writes(session):
+    """table -> ids written but not yet committed in the session (empty when none)."""
+    return session.info.get(PENDING_KEY) or {}
+
+
+def has_uncommitted_writes(session):
+    """True while the session holds writes, flushed or not, that are not committed."""
+    return bool(pending_writes(session) or session.new or session.dirty or session.deleted)
+
+
+class LRUCache:
+    """In-process cache bounded by entry count, with per-entry TTL."""
+
+    def __init__(self, maxsize=10000, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'backend': 'memory', 'hits': self.hits, 'misses': self.misses,
+                'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+class RedisCache:
+    """
+    Cache shared by all workers, so a write in one process invalidates
+    the entry for every other process too. Redis handles TTL and eviction
+    (configure maxmemory-policy allkeys-lru on the server).
+    """
+
+    def __init__(self, url, ttl=300, prefix='hbnb:'):
+        if redis is None:
+            raise RuntimeError("REPOSITORY_CACHE='redis' requires the redis package")
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        raw = self._client.get(self.prefix + key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(raw)
+
+    def set(self, key, value):
+        self._client.set(self.prefix + key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=self.ttl)
+
+    def delete(self, key):
+        self._client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self._client.scan_iter(match=self.prefix + '*'):
+            self._client.delete(key)
+
+    def stats(self):
+        return {'backend': 'redis', 'hits': self.hits, 'misses': self.misses}
+
+
+def get_cache():
+    """The cache configured for the current app, or None when disabled."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get(EXTENSION_KEY)
+
+
+def _invalidate_flushed(session, flush_context):
+    cache = get_cache()
+    if cache is None:
+        return
+    changed = {}
+    for obj in list(session.dirty) + list(session.deleted):
+        table = getattr(obj, '__tablename__', None)
+        if table:
+            changed.setdefault(table, []).append(obj.id)
+    for table, obj_ids in changed.items():
+        invalidate_pending(session, cache, table, obj_ids)
+
+
+def _invalidate_ended(session, *args):
+    """Invalidates the writes of a transaction again once it committed or rolled back."""
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    cache = get_cache()
+    if cache is None:
+        return
+    if ALL_TABLES in pending:
+        cache.clear()
+        return
+    for table, obj_ids in pending.items():
+        invalidate(cache, table, obj_ids)
+
+
+def _invalidate_transaction_end(session, transaction):
+    # close() ends the transaction without after_rollback
+    if transaction.parent is None:
+        _invalidate_ended(session)
+
+
+def init_app(app):
+    """
+    Sets up the backend named by REPOSITORY_CACHE ('memory', 'redis' or
+    None) and registers flush-time invalidation for changes made on ORM
+    objects outside the repository, repeated at commit/rollback.
+    """
+    backend = app.config.get('REPOSITORY_CACHE')
+    ttl = app.config.get('REPOSITORY_CACHE_TTL', 300)
+    if backend == 'memory':
+        cache = LRUCache(maxsize=app.config.get('REPOSITORY_CACHE_SIZE', 10000), ttl=ttl)
+    elif backend == 'redis':
+        cache = RedisCache(app.config['REPOSITORY_CACHE_REDIS_URL'], ttl=ttl)
+    elif not backend:
+        return
+    else:
+        raise ValueError(f"Unknown REPOSITORY_CACHE backend '{backend}'")
+    app.extensions[EXTENSION_KEY] = cache
+
+    for name, listener in (('after_flush', _invalidate_flushed),
+                           ('after_commit', _invalidate_ended),
+                           ('after_rollback', _invalidate_ended),
+                           ('after_transaction_end', _invalidate_transaction_end)):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
@@ -0,0 +1,38 @@
+#!/usr/bin/python3
+"""Engine tuning applied to every new DBAPI connection."""
+
+from sqlalchemy import event
+from app import db
+
+
+def init_app(app):
+    """
+    Registers a connect hook that runs the SQLITE_PRAGMAS from the config
+    (journal_mode, synchronous, busy_timeout, ...) on each SQLite connection.
+    Does nothing for other databases or when no pragmas are configured.
+    """
+    pragmas = app.config.get('SQLITE_PRAGMAS')
+    if not pragmas:
+        return
+
+    with app.app_context():
+        engine = db.engine
+    set_sqlite_pragmas(engine, pragmas)
+
+
+def set_sqlite_pragmas(engine, pragmas):
+    """
+    Runs pragmas ({name: value}) on each new connection of a sync Engine;
+    for an AsyncEngine pass its sync_engine. No-op unless it is SQLite.
+    """
+    if not pragmas or engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
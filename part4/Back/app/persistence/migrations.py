@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+"""Schema upgrades that db.create_all() does not apply to existing databases."""
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app import db
+
+
+def ensure_indexes():
+    """
+    Creates any index declared on the models that is missing from the
+    database. create_all() only builds indexes together with new tables,
+    so databases created before an index was declared need this.
+    Returns the names of the indexes created.
+    """
+    inspector = inspect(db.engine)
+    tables = set(inspector.get_table_names())
+    created = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        present = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in present:
+                continue
+            try:
+                index.create(db.engine)
+            except (IntegrityError, OperationalError) as e:
+                # e.g. duplicate (user_id, place_id) reviews block the unique index
+                print(f"⚠️  Could not create index {index.name}: {e.orig}")
+                continue
+            created.append(index.name)
+    if created:
+        print(f"✅ Created indexes: {', '.join(created)}")
+    return created
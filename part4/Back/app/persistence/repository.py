@@ -1,7 +1,167 @@
 #!/usr/bin/python3
 
+import base64
+import json
+from bisect import bisect_left, bisect_right, insort
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from datetime import datetime, timezone
+from sqlalchemy import and_, bindparam, delete, insert, or_, select, tuple_, update
+from sqlalchemy.orm import lazyload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 from app import db
+from app.persistence.cache import (ALL_TABLES, cache_key, clear_pending, get_cache,
+                                   invalidate_pending, pending_writes, table_generation)
+from app.persistence.unit_of_work import commit
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+BULK_CHUNK_SIZE = 1000
+
+
+def encode_cursor(order_by, value, obj_id):
+    """Packs the keyset position of the last row of a page into an opaque token."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([order_by, value, obj_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Unpacks a token built by encode_cursor into (order_by, value, id).
+    Raises ValueError if the token was not produced by us.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        order_by, value, obj_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+    return order_by, value, obj_id
+
+
+def _parse_order(order_by):
+    """'-rating' -> ('rating', True); 'created_at' -> ('created_at', False)"""
+    if order_by.startswith('-'):
+        return order_by[1:], True
+    return order_by, False
+
+
+def _check_limit(limit):
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _cursor_position(after, order_by):
+    cursor_order, value, last_id = decode_cursor(after)
+    if cursor_order != order_by:
+        raise ValueError("Cursor does not match the requested ordering")
+    return value, last_id
+
+
+def where_clause(model, filters):
+    """
+    dict of attribute -> value (list/tuple/set for IN), or a SQL expression.
+    A tuple of attributes as the key takes a collection of value tuples,
+    matched as a row-value IN: {("user_id", "place_id"): [(u, p), ...]}.
+    """
+    if not isinstance(filters, dict):
+        return filters
+    clauses = []
+    for attr, expected in filters.items():
+        if isinstance(attr, tuple):
+            unknown = [name for name in attr if name not in model.__table__.columns]
+            if unknown:
+                raise ValueError(f"Unknown attribute '{unknown[0]}'")
+            clauses.append(tuple_(*(getattr(model, name) for name in attr)).in_(list(expected)))
+            continue
+        if attr not in model.__table__.columns:
+            raise ValueError(f"Unknown attribute '{attr}'")
+        column = getattr(model, attr)
+        if isinstance(expected, (list, tuple, set, frozenset)):
+            clauses.append(column.in_(list(expected)))
+        else:
+            clauses.append(column == expected)
+    return and_(*clauses)
+
+
+def page_statement(model, after, limit, order_by, columns=None, filters=None):
+    """
+    Builds the keyset SELECT behind get_page(). Returns (statement, limit);
+    the statement fetches one row more than limit so finish_page() can tell
+    whether another page exists.
+    """
+    limit = _check_limit(limit)
+    attr, descending = _parse_order(order_by)
+    table_columns = model.__table__.columns
+    if attr not in table_columns:
+        raise ValueError(f"Cannot order by '{attr}'")
+    column = getattr(model, attr)
+    pk = model.id
+
+    if columns:
+        unknown = [name for name in columns if name not in table_columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        # the cursor needs the sort key and id of the last row
+        selected = list(dict.fromkeys(list(columns) + [attr, 'id']))
+        stmt = select(*(getattr(model, name) for name in selected))
+    else:
+        stmt = select(model)
+
+    if filters:
+        stmt = stmt.where(where_clause(model, filters))
+    if after:
+        value, last_id = _cursor_position(after, order_by)
+        if isinstance(column.type, db.DateTime) and value is not None:
+            value = datetime.fromisoformat(value)
+        if attr == 'id':
+            stmt = stmt.where(pk < last_id if descending else pk > last_id)
+        # the redundant bound on column alone lets the index seek to the
+        # cursor; the OR by itself only narrows on the leading columns
+        elif descending:
+            stmt = stmt.where(column <= value,
+                              or_(column < value, and_(column == value, pk < last_id)))
+        else:
+            stmt = stmt.where(column >= value,
+                              or_(column > value, and_(column == value, pk > last_id)))
+
+    if attr == 'id':
+        ordering = [pk.desc() if descending else pk.asc()]
+    elif descending:
+        ordering = [column.desc(), pk.desc()]
+    else:
+        ordering = [column.asc(), pk.asc()]
+    return stmt.order_by(*ordering).limit(limit + 1), limit
+
+
+def finish_page(rows, limit, order_by):
+    """Trims the extra row fetched by page_statement() into a next_cursor."""
+    attr, _ = _parse_order(order_by)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(order_by, getattr(last, attr), last.id)
+    return rows, next_cursor
+
+
+def _matches(obj, filters):
+    for attr, expected in filters.items():
+        if isinstance(attr, tuple):
+            if tuple(getattr(obj, name) for name in attr) not in expected:
+                return False
+            continue
+        value = getattr(obj, attr)
+        if isinstance(expected, (list, tuple, set, frozenset)):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    return True
+
 
 class Repository(ABC):
     @abstractmethod
@@ -12,6 +172,14 @@ class Repository(ABC):
     def get(self, obj_id):
         pass
 
+    @abstractmethod
+    def get_many(self, obj_ids):
+        """
+        Loads several objects at once.
+        Returns (found, missing_ids), both in the order the ids were given.
+        """
+        pass
+
     @abstractmethod
     def get_all(self):
         pass
@@ -28,60 +196,544 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def exists(self, **filters):
+        """True if at least one object matches every attribute=value filter."""
+        pass
+
+    @abstractmethod
+    def get_page(self, after=None, limit=DEFAULT_PAGE_SIZE, order_by='id', columns=None, options=(),
+                 filters=None):
+        """
+        Returns (items, next_cursor) for one keyset page.
+        next_cursor is None once the last page has been reached.
+        With columns=('id', 'name', ...) items are lightweight named rows
+        holding just those fields instead of full entities.
+        options are ORM loader options (e.g. joinedload) for SQL backends.
+        filters ({attr: value}, as for exists()) restricts the rows paged over.
+        """
+        pass
+
+    def iter_all(self, chunk_size=BULK_CHUNK_SIZE, options=()):
+        """
+        Iterates over every object without building the full list.
+        Backends that can stream override this.
+        """
+        yield from self.get_all()
+
+    # Bulk variants. Backends that can batch writes override these;
+    # the defaults fall back to one call per object.
+    def add_many(self, objs, chunk_size=BULK_CHUNK_SIZE):
+        for obj in objs:
+            self.add(obj)
+        return len(objs)
+
+    def update_many(self, updates, chunk_size=BULK_CHUNK_SIZE):
+        """updates maps obj_id -> dict of new attribute values"""
+        count = 0
+        for obj_id, data in updates.items():
+            if self.get(obj_id):
+                self.update(obj_id, data)
+                count += 1
+        return count
+
+    def delete_many(self, obj_ids, chunk_size=BULK_CHUNK_SIZE):
+        count = 0
+        for obj_id in obj_ids:
+            if self.get(obj_id):
+                self.delete(obj_id)
+                count += 1
+        return count
+
+    # Set-based writes. filters is a dict of attribute -> value (a list,
+    # tuple or set value means "one of"; a tuple of attributes as the key
+    # matches value tuples); the defaults scan get_all().
+    def update_where(self, filters, values, validate=False):
+        matches = [obj for obj in self.get_all() if _matches(obj, filters)]
+        for obj in matches:
+            self.update(obj.id, values)
+        return len(matches)
+
+    def delete_where(self, filters):
+        matches = [obj for obj in self.get_all() if _matches(obj, filters)]
+        for obj in matches:
+            self.delete(obj.id)
+        return len(matches)
+
+    def select_where(self, filters, columns):
+        """Named rows holding just columns, for every object matching filters."""
+        row = namedtuple('Row', columns)
+        return [row(*(getattr(obj, name) for name in columns))
+                for obj in self.get_all() if _matches(obj, filters)]
+
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    """
+    Dict-backed repository. Attributes listed in `indexes` (or `unique`, which
+    also rejects a second object with the same value) get a hash index, so
+    lookups and filters on them are dict lookups instead of scans. Change
+    indexed attributes through the repository so the indexes follow.
+
+    The first get_page() on an attribute builds a sorted (value, id) list
+    for it, kept up to date by add/update/delete, so every later page is a
+    bisect plus a slice of limit entries, however deep the cursor. Pages
+    with filters sort just the matching objects instead.
+    """
+
+    def __init__(self, indexes=(), unique=()):
         self._storage = {}
+        self._unique = frozenset(unique)
+        # attr -> value -> {obj_id: obj}, insertion ordered like _storage
+        self._indexes = {attr: {} for attr in dict.fromkeys((*unique, *indexes))}
+        # obj_id -> indexed values at the time it was (re)indexed
+        self._indexed_values = {}
+        # attr -> sorted [(value, id)], and attr -> {id: (value, id)} in it
+        self._sorted = {}
+        self._sort_keys = {}
+
+    def _index_values(self, obj):
+        return tuple(getattr(obj, attr, None) for attr in self._indexes)
+
+    def _check_unique(self, obj_id, values):
+        for attr, value in zip(self._indexes, values):
+            if attr in self._unique and value is not None:
+                holders = self._indexes[attr].get(value)
+                if holders and (len(holders) > 1 or obj_id not in holders):
+                    raise ValueError(f"{attr} '{value}' is already in use")
+
+    def _index(self, obj, values):
+        self._indexed_values[obj.id] = values
+        for attr, value in zip(self._indexes, values):
+            self._indexes[attr].setdefault(value, {})[obj.id] = obj
+
+    def _unindex(self, obj_id):
+        values = self._indexed_values.pop(obj_id, None)
+        if values is None:
+            return
+        for attr, value in zip(self._indexes, values):
+            holders = self._indexes[attr][value]
+            del holders[obj_id]
+            if not holders:
+                del self._indexes[attr][value]
+
+    @staticmethod
+    def _sort_key(obj, attr):
+        value = getattr(obj, attr)
+        # cursors carry datetimes as ISO strings, compare on the same footing
+        return (value.isoformat() if isinstance(value, datetime) else value, obj.id)
+
+    def _sorted_keys(self, attr):
+        keys = self._sorted.get(attr)
+        if keys is None:
+            positions = {obj_id: self._sort_key(obj, attr) for obj_id, obj in self._storage.items()}
+            keys = self._sorted[attr] = sorted(positions.values())
+            self._sort_keys[attr] = positions
+        return keys
+
+    def _resort(self, obj):
+        """Moves obj in every sorted list built so far, or drops it once deleted."""
+        for attr, keys in self._sorted.items():
+            positions = self._sort_keys[attr]
+            old = positions.pop(obj.id, None)
+            if old is not None:
+                del keys[bisect_left(keys, old)]
+            if obj.id in self._storage:
+                positions[obj.id] = key = self._sort_key(obj, attr)
+                insort(keys, key)
+
+    def _candidates(self, filters):
+        """Objects that can match filters: one index bucket when a filter is indexed."""
+        for attr, expected in filters.items():
+            if attr in self._indexes and not isinstance(expected, (list, tuple, set, frozenset)):
+                return list(self._indexes[attr].get(expected, {}).values())
+        return list(self._storage.values())
 
     def add(self, obj):
+        if self._indexes:
+            values = self._index_values(obj)
+            self._check_unique(obj.id, values)
+            self._unindex(obj.id)
+            self._index(obj, values)
         self._storage[obj.id] = obj
+        if self._sorted:
+            self._resort(obj)
 
     def get(self, obj_id):
         return self._storage.get(obj_id)
 
+    def get_many(self, obj_ids):
+        found, missing = [], []
+        for obj_id in dict.fromkeys(obj_ids):
+            obj = self._storage.get(obj_id)
+            if obj is None:
+                missing.append(obj_id)
+            else:
+                found.append(obj)
+        return found, missing
+
     def get_all(self):
         return list(self._storage.values())
 
     def update(self, obj_id, data):
         obj = self._storage.get(obj_id)
         if obj:
+            old_values = self._indexed_values.get(obj_id)
             for key, value in data.items():
                 setattr(obj, key, value)
+            if self._sorted:
+                self._resort(obj)
+            if not self._indexes:
+                return
+            values = self._index_values(obj)
+            if values != old_values:
+                try:
+                    self._check_unique(obj_id, values)
+                except ValueError:
+                    for attr, value in zip(self._indexes, old_values):
+                        setattr(obj, attr, value)
+                    raise
+                self._unindex(obj_id)
+                self._index(obj, values)
 
     def delete(self, obj_id):
-        if obj_id in self._storage:
-            del self._storage[obj_id]
+        obj = self._storage.pop(obj_id, None)
+        if obj is not None:
+            self._unindex(obj_id)
+            if self._sorted:
+                self._resort(obj)
 
     def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes:
+            holders = self._indexes[attr_name].get(attr_value)
+            return next(iter(holders.values())) if holders else None
         return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
 
+    def find_by(self, attr_name, attr_value):
+        """All objects whose attribute equals the value, in insertion order."""
+        if attr_name in self._indexes:
+            return list(self._indexes[attr_name].get(attr_value, {}).values())
+        return [obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value]
+
+    def exists(self, **filters):
+        if 'id' in filters:
+            obj = self._storage.get(filters['id'])
+            return obj is not None and _matches(obj, filters)
+        return any(_matches(obj, filters) for obj in self._candidates(filters))
+
+    def update_where(self, filters, values, validate=False):
+        matches = [obj for obj in self._candidates(filters) if _matches(obj, filters)]
+        for obj in matches:
+            self.update(obj.id, values)
+        return len(matches)
+
+    def delete_where(self, filters):
+        matches = [obj for obj in self._candidates(filters) if _matches(obj, filters)]
+        for obj in matches:
+            self.delete(obj.id)
+        return len(matches)
+
+    def select_where(self, filters, columns):
+        row = namedtuple('Row', columns)
+        return [row(*(getattr(obj, name) for name in columns))
+                for obj in self._candidates(filters) if _matches(obj, filters)]
+
+    def get_page(self, after=None, limit=DEFAULT_PAGE_SIZE, order_by='id', columns=None, options=(),
+                 filters=None):
+        limit = _check_limit(limit)
+        attr, descending = _parse_order(order_by)
+        position = tuple(_cursor_position(after, order_by)) if after else None
+
+        if filters:
+            keys = sorted(self._sort_key(obj, attr) for obj in self._candidates(filters)
+                          if _matches(obj, filters))
+        else:
+            keys = self._sorted_keys(attr)
+        # one entry past the page tells whether another page follows
+        if descending:
+            end = bisect_left(keys, position) if position else len(keys)
+            window = keys[max(end - limit - 1, 0):end][::-1]
+        else:
+            start = bisect_right(keys, position) if position else 0
+            window = keys[start:start + limit + 1]
+        objs = [self._storage[obj_id] for _, obj_id in window]
+
+        page = objs[:limit]
+        next_cursor = None
+        if len(objs) > limit:
+            last = page[-1]
+            next_cursor = encode_cursor(order_by, getattr(last, attr), last.id)
+        if columns:
+            row = namedtuple('Row', columns)
+            page = [row(*(getattr(obj, name) for name in columns)) for obj in page]
+        return page, next_cursor
+
 class SQLAlchemyRepository(Repository):
     def __init__(self, model):
         self.model = model
+        # attr_name -> prebuilt SELECT with a bound parameter, so hot lookups
+        # reuse one statement (and its compiled form) instead of rebuilding it
+        self._attribute_stmts = {}
 
     def add(self, obj):
         db.session.add(obj)
-        db.session.commit()
+        self._invalidate(obj.id)
+        commit()
 
     def get(self, obj_id):
-        return self.model.query.get(obj_id)
+        """
+        Read-through: objects already in the session come from the identity
+        map, then the repository cache, then the database. Rows read while
+        the session has uncommitted writes, or while the table was written
+        to, are not cached, and rows the session wrote are not read from
+        the cache.
+        """
+        cache = get_cache()
+        if cache is None or obj_id is None:
+            return db.session.get(self.model, obj_id)
+        if identity_key(self.model, obj_id) in db.session.identity_map:
+            return db.session.get(self.model, obj_id)
+
+        table = self.model.__tablename__
+        key = cache_key(table, obj_id)
+        pending = pending_writes(db.session)
+        if ALL_TABLES not in pending and obj_id not in pending.get(table, ()):
+            values = cache.get(key)
+            if values is not None:
+                return self._from_cache(values)
+
+        # a write committed elsewhere between the SELECT and the set below
+        # would be overwritten by the stale row: it moves the generation
+        generation = table_generation(cache, table)
+        obj = db.session.get(self.model, obj_id)
+        # checked after the SELECT, which may have autoflushed
+        if (obj is not None and not pending_writes(db.session)
+                and table_generation(cache, table) == generation):
+            cache.set(key, {column.key: getattr(obj, column.key)
+                            for column in self.model.__table__.columns})
+        return obj
+
+    def _from_cache(self, values):
+        """Rebuilds a clean persistent instance in the current session, without a SELECT."""
+        obj = self.model.__mapper__.class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(obj, key, value)
+        make_transient_to_detached(obj)
+        db.session.add(obj)
+        return obj
+
+    def _invalidate(self, *obj_ids):
+        cache = get_cache()
+        if cache is not None and obj_ids:
+            invalidate_pending(db.session, cache, self.model.__tablename__, obj_ids)
+
+    def get_many(self, obj_ids, chunk_size=BULK_CHUNK_SIZE):
+        """One SELECT ... WHERE id IN (...) per chunk instead of one get() per id."""
+        obj_ids = list(dict.fromkeys(obj_ids))
+        by_id = {}
+        for start in range(0, len(obj_ids), chunk_size):
+            chunk = obj_ids[start:start + chunk_size]
+            for obj in self.model.query.filter(self.model.id.in_(chunk)):
+                by_id[obj.id] = obj
+        found = [by_id[obj_id] for obj_id in obj_ids if obj_id in by_id]
+        missing = [obj_id for obj_id in obj_ids if obj_id not in by_id]
+        return found, missing
 
     def get_all(self):
         return self.model.query.all()
 
+    def iter_all(self, chunk_size=BULK_CHUNK_SIZE, options=()):
+        """
+        Streams the table in chunks of chunk_size rows (yield_per), so memory
+        stays flat however large it is. Eager loaders are switched off for
+        the scan unless requested in options (joinedload of a many-to-one
+        streams fine); other relationships load lazily if touched. Do not
+        commit on the same session while the iteration is in progress.
+        """
+        stmt = (select(self.model)
+                .options(lazyload('*'), *options)
+                .execution_options(yield_per=chunk_size))
+        yield from db.session.execute(stmt).scalars()
+
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+            self._invalidate(obj_id)
+            commit()
 
     def delete(self, obj_id):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            self._invalidate(obj_id)
+            commit()
 
     def get_by_attribute(self, attr_name, attr_value):
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
-    
\ No newline at end of file
+        stmt = self._attribute_stmts.get(attr_name)
+        if stmt is None:
+            if attr_name not in self.model.__table__.columns:
+                raise ValueError(f"Unknown attribute '{attr_name}'")
+            # the parameter is named after the column, as the slow query
+            # log expects when it redacts values (see app/slow_queries.py)
+            stmt = (select(self.model)
+                    .where(getattr(self.model, attr_name) == bindparam(attr_name))
+                    .limit(1))
+            self._attribute_stmts[attr_name] = stmt
+        return db.session.execute(stmt, {attr_name: attr_value}).scalars().first()
+
+    def exists(self, **filters):
+        """SELECT EXISTS(SELECT id ... WHERE ...): no row is loaded or hydrated."""
+        stmt = select(select(self.model.id).where(self._where(filters)).exists())
+        return db.session.execute(stmt).scalar()
+
+    def select_where(self, filters, columns):
+        """One SELECT of just columns ... WHERE filters; plain rows, no entities."""
+        unknown = [name for name in columns if name not in self.model.__table__.columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        stmt = select(*(getattr(self.model, name) for name in columns)).where(self._where(filters))
+        return db.session.execute(stmt).all()
+
+    def _row(self, obj):
+        """
+        Column values of a transient object as a plain dict, with
+        column defaults (id, timestamps, ...) filled in on the object too
+        so callers can read them back after a Core insert.
+        """
+        row = {}
+        for column in self.model.__table__.columns:
+            value = getattr(obj, column.key, None)
+            if value is None and column.default is not None:
+                default = column.default
+                value = default.arg(None) if default.is_callable else default.arg
+                setattr(obj, column.key, value)
+            row[column.key] = value
+        return row
+
+    def add_many(self, objs, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Inserts objects with one executemany INSERT and one commit per chunk
+        (inside a unit of work the commit is left to the unit of work).
+        Objects are not attached to the session; relationships must be
+        given as foreign key columns (e.g. user_id), not related objects.
+        """
+        objs = list(objs)
+        for start in range(0, len(objs), chunk_size):
+            rows = [self._row(obj) for obj in objs[start:start + chunk_size]]
+            db.session.execute(insert(self.model.__table__), rows)
+            commit()
+        return len(objs)
+
+    def update_many(self, updates, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Applies {obj_id: {column: value}} as executemany UPDATEs by primary
+        key, one commit per chunk. Model validators do not run here, so
+        callers must validate values first. Returns the number of rows matched.
+        """
+        table = self.model.__table__
+        items = list(updates.items())
+        count = 0
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            now = datetime.now(timezone.utc)
+            # group by column set so each group is a single executemany
+            groups = {}
+            for obj_id, data in chunk:
+                values = dict(data)
+                if 'updated_at' in table.columns:
+                    values['updated_at'] = now
+                groups.setdefault(tuple(sorted(values)), []).append(
+                    dict(values, _obj_id=obj_id))
+            for keys, rows in groups.items():
+                stmt = (update(table)
+                        .where(table.c.id == db.bindparam('_obj_id'))
+                        .values({key: db.bindparam(key) for key in keys}))
+                count += db.session.execute(stmt, rows).rowcount
+            self._invalidate(*(obj_id for obj_id, _ in chunk))
+            commit()
+        return count
+
+    def delete_many(self, obj_ids, chunk_size=BULK_CHUNK_SIZE):
+        """Deletes rows with one DELETE ... WHERE id IN (...) per chunk."""
+        obj_ids = list(obj_ids)
+        count = 0
+        for start in range(0, len(obj_ids), chunk_size):
+            chunk = obj_ids[start:start + chunk_size]
+            result = db.session.execute(
+                delete(self.model.__table__).where(self.model.__table__.c.id.in_(chunk)))
+            count += result.rowcount
+            self._invalidate(*chunk)
+            commit()
+        return count
+
+    def _where(self, filters):
+        return where_clause(self.model, filters)
+
+    def _validated(self, values):
+        """Runs the model's @validates hooks on values, without loading any row."""
+        probe = self.model.__mapper__.class_manager.new_instance()
+        for key, value in values.items():
+            if key not in self.model.__table__.columns:
+                raise ValueError(f"Unknown attribute '{key}'")
+            setattr(probe, key, value)
+        return {key: getattr(probe, key) for key in values}
+
+    def _execute_set_based(self, stmt):
+        """
+        Runs an ORM-enabled UPDATE/DELETE (objects already in the session are
+        synchronized) and returns the affected row count. Where the database
+        supports RETURNING the affected ids are invalidated in the cache,
+        otherwise the whole cache is cleared.
+        """
+        cache = get_cache()
+        dialect = db.session.get_bind().dialect
+        if cache is None:
+            return db.session.execute(stmt).rowcount
+        if dialect.update_returning and dialect.delete_returning:
+            obj_ids = db.session.execute(stmt.returning(self.model.id)).scalars().all()
+            self._invalidate(*obj_ids)
+            return len(obj_ids)
+        count = db.session.execute(stmt).rowcount
+        clear_pending(db.session, cache)
+        return count
+
+    def update_where(self, filters, values, validate=False):
+        """
+        One UPDATE ... WHERE for every matching row, without loading them.
+        validate=True runs the model's validators on values first.
+        Returns the number of rows updated.
+        """
+        if validate:
+            values = self._validated(values)
+        stmt = update(self.model).where(self._where(filters)).values(**values)
+        count = self._execute_set_based(stmt)
+        commit()
+        return count
+
+    def delete_where(self, filters):
+        """One DELETE ... WHERE; returns the number of rows deleted."""
+        stmt = delete(self.model).where(self._where(filters))
+        count = self._execute_set_based(stmt)
+        commit()
+        return count
+
+    def get_page(self, after=None, limit=DEFAULT_PAGE_SIZE, order_by='id', columns=None, options=(),
+                 filters=None):
+        """
+        Keyset pagination: seeks past the last row of the previous page
+        instead of OFFSET-ing, so every page costs O(limit) on the index.
+        A columns projection selects only those columns and returns plain
+        rows, skipping entity hydration, the identity map and eager loads.
+        options (entities only) load relationships in the same statement,
+        e.g. joinedload(Review.user) instead of one query per row.
+        filters become the WHERE clause; with an index on the filter columns
+        followed by the sort key, e.g. (place_id, created_at, id), a page
+        of one place's rows is a single index range read.
+        """
+        stmt, limit = page_statement(self.model, after, limit, order_by, columns, filters)
+        if options and not columns:
+            stmt = stmt.options(*options)
+        result = db.session.execute(stmt)
+        rows = result.all() if columns else result.scalars().all()
+        return finish_page(rows, limit, order_by)
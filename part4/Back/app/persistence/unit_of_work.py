@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""
+Unit of work: groups repository writes into a single commit.
+
+Outside a unit of work every repository write commits on its own, as before.
+Inside one (an explicit `with unit_of_work():` block, or the whole request
+when the app factory turns it on) writes only stage changes on the session
+and the outermost scope flushes and commits once at the end.
+"""
+
+from contextlib import contextmanager
+from flask import g
+from app import db
+
+
+def in_unit_of_work():
+    """True while a unit of work is open in the current app context."""
+    return g.get('uow_depth', 0) > 0
+
+
+def commit():
+    """Commits now, unless a unit of work is open - then its end commits."""
+    if not in_unit_of_work():
+        db.session.commit()
+
+
+def begin():
+    g.uow_depth = g.get('uow_depth', 0) + 1
+
+
+def end(success=True):
+    """
+    Closes one level of unit of work. The outermost level commits on
+    success and rolls back otherwise.
+    """
+    depth = g.get('uow_depth', 0)
+    if depth == 0:
+        return
+    g.uow_depth = depth - 1
+    if depth > 1:
+        if not success:
+            # a failed inner scope dooms the whole unit of work
+            g.uow_rollback_only = True
+        return
+    rollback_only = g.pop('uow_rollback_only', False)
+    if success and not rollback_only:
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+    else:
+        db.session.rollback()
+
+
+@contextmanager
+def unit_of_work():
+    """Nestable transaction scope; only the outermost one commits."""
+    begin()
+    try:
+        yield db.session
+    except BaseException:
+        end(success=False)
+        raise
+    end()
+
+
+def init_app(app):
+    """Wraps each request in a unit of work (SQLALCHEMY_REQUEST_UNIT_OF_WORK)."""
+    if not app.config.get('SQLALCHEMY_REQUEST_UNIT_OF_WORK'):
+        return
+
+    @app.before_request
+    def _begin_request_unit_of_work():
+        begin()
+
+    @app.after_request
+    def _end_request_unit_of_work(response):
+        # error responses (validation failures etc.) must not persist half-done work
+        end(success=response.status_code < 400)
+        return response
+
+    @app.teardown_request
+    def _abort_request_unit_of_work(error=None):
+        # after_request is skipped when the view raises
+        if in_unit_of_work():
+            g.uow_depth = 1
+            end(success=False)
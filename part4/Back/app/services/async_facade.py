@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+"""Async facade: read paths of HBnBFacade for asyncio servers."""
+from sqlalchemy.orm import selectinload
+from app.models.review import Review
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.models.user import User
+from app.persistence.async_repository import AsyncSQLAlchemyRepository, async_session_factory
+from app.persistence.repository import DEFAULT_PAGE_SIZE
+from app.services.facade import REVIEW_SORTS
+
+
+class AsyncHBnBFacade:
+    """
+    Mirrors the read methods of HBnBFacade and returns the same shapes,
+    but every query is awaited instead of blocking the calling thread.
+    """
+
+    def __init__(self, session_factory):
+        self.user_repo = AsyncSQLAlchemyRepository(User, session_factory)
+        self.place_repo = AsyncSQLAlchemyRepository(Place, session_factory)
+        self.review_repo = AsyncSQLAlchemyRepository(Review, session_factory)
+        self.amenity_repo = AsyncSQLAlchemyRepository(Amenity, session_factory)
+
+    @classmethod
+    def from_app(cls, app, **engine_options):
+        """Builds a facade on the same database and SQLite pragmas as the Flask app."""
+        from app import db
+        with app.app_context():
+            url = db.engine.url
+        return cls(async_session_factory(url, app.config.get('SQLITE_PRAGMAS'), **engine_options))
+
+    async def get_user(self, user_id):
+        return await self.user_repo.get(user_id)
+
+    async def get_user_by_email(self, email):
+        return await self.user_repo.get_by_attribute("email", email)
+
+    async def get_all_users(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        return await self.user_repo.get_page(after=after, limit=limit,
+                                             columns=("id", "first_name", "last_name", "email"))
+
+    async def get_amenity(self, amenity_id):
+        return await self.amenity_repo.get(amenity_id)
+
+    async def get_all_amenities(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        return await self.amenity_repo.get_page(after=after, limit=limit, columns=("id", "name"))
+
+    async def get_place(self, place_id):
+        """Place details with owner and amenities, loaded in the same round trip set."""
+        place = await self.place_repo.get(
+            place_id, options=(selectinload(Place.owner), selectinload(Place.amenities)))
+        if not place:
+            return None
+
+        owner = place.owner
+        return {
+            "id": place.id,
+            "title": place.title,
+            "description": place.description,
+            "price": place.price,
+            "latitude": place.latitude,
+            "longitude": place.longitude,
+            "owner": {
+                "id": owner.id,
+                "first_name": owner.first_name,
+                "last_name": owner.last_name,
+                "email": owner.email
+            },
+            "amenities": [{"id": amenity.id, "name": amenity.name} for amenity in place.amenities]
+        }
+
+    async def get_all_places(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        places, next_cursor = await self.place_repo.get_page(
+            after=after, limit=limit,
+            columns=("id", "title", "price", "latitude", "longitude"))
+        return [
+            {
+                "id": place.id,
+                "title": place.title,
+                "price": place.price,
+                "latitude": place.latitude,
+                "longitude": place.longitude
+            }
+            for place in places
+        ], next_cursor
+
+    def _review_dict(self, review):
+        user = review.user
+        return {
+            "id": review.id,
+            "text": review.text,
+            "rating": review.rating,
+            "user_id": review.user_id,
+            "user_name": f"{user.first_name} {user.last_name}" if user else "",
+            "place_id": review.place_id
+        }
+
+    async def get_review(self, review_id):
+        review = await self.review_repo.get(review_id, options=(selectinload(Review.user),))
+        if not review:
+            return None
+        return self._review_dict(review)
+
+    async def get_all_reviews(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        reviews, next_cursor = await self.review_repo.get_page(
+            after=after, limit=limit, options=(selectinload(Review.user),))
+        return [self._review_dict(review) for review in reviews], next_cursor
+
+    async def get_reviews_by_place(self, place_id, after=None, limit=DEFAULT_PAGE_SIZE, sort='newest'):
+        """Same page, cursor and sorts as HBnBFacade.get_reviews_by_place()."""
+        if sort not in REVIEW_SORTS:
+            raise ValueError(f"sort must be one of: {', '.join(REVIEW_SORTS)}")
+        if not await self.place_repo.exists(id=place_id):
+            return None  # Place not found
+        reviews, next_cursor = await self.review_repo.get_page(
+            after=after, limit=limit, order_by=REVIEW_SORTS[sort],
+            options=(selectinload(Review.user),), filters={"place_id": place_id})
+        return [self._review_dict(review) for review in reviews], next_cursor
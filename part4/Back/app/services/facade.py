@@ -1,10 +1,27 @@
 #!/usr/bin/python3
 """Facade: Manages logic between API and Models for all resources."""
+from sqlalchemy.orm import joinedload
+from app import db
 from app.models.review import Review
 from app.models.place import Place
 from app.models.amenity import Amenity
 from app.models.user import User
-from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.cache import cache_key, get_cache, has_uncommitted_writes, table_generation
+from app.persistence.repository import SQLAlchemyRepository, DEFAULT_PAGE_SIZE, BULK_CHUNK_SIZE
+from app.persistence.unit_of_work import unit_of_work
+
+# sort option of get_reviews_by_place -> get_page order_by
+REVIEW_SORTS = {'newest': '-created_at', 'rating': '-rating'}
+
+
+def review_author():
+    """
+    Loader option fetching a review's author names in the review query
+    itself (LEFT OUTER JOIN users). Built on call: Review.user is a backref
+    that only exists once the mappers are configured.
+    """
+    return joinedload(Review.user).load_only(User.first_name, User.last_name)
+
 
 class HBnBFacade: #new class for facade
     def __init__(self): #constructor
@@ -13,6 +30,15 @@ class HBnBFacade: #new class for facade
         self.review_repo = SQLAlchemyRepository(Review)
         self.amenity_repo = SQLAlchemyRepository(Amenity)
 
+    def transaction(self):
+        """
+        Groups several facade calls into one commit:
+            with facade.transaction():
+                facade.create_review(...)
+                facade.create_review(...)
+        Nested inside a request (or another transaction) it joins the outer one.
+        """
+        return unit_of_work()
 
     # Placeholder method for creating a user
     def create_user(self, data):
@@ -21,7 +47,7 @@ class HBnBFacade: #new class for facade
         except ValueError as e:
             raise ValueError("Invalid input data")
 
-        if self.get_user_by_email(user.email):
+        if self.user_repo.exists(email=user.email):
             raise ValueError("Email already registered")
         # Hash password if provided in payload
         if 'password' in data and data['password']:
@@ -39,14 +65,24 @@ class HBnBFacade: #new class for facade
     def get_user_by_email(self, email): #prevent duplicate registration
         """
         Searches for a user by email address.
-        Uses internal attribute indexing in repository.
+        Uses the repository's prebuilt attribute lookup (unique index on email).
+        """
+        return self.user_repo.get_by_attribute("email", email)
+
+    def email_taken(self, email, exclude_user_id=None):
         """
-        #looks through all stored users and returns the one with user.email == value
-        return User.query.filter_by(email=email).first()
+        True if another user already registered this email.
+        Runs as EXISTS queries on the unique email index, no User is loaded.
+        """
+        if not self.user_repo.exists(email=email):
+            return False
+        # email is unique, so the only holder may be the excluded user
+        return not (exclude_user_id and self.user_repo.exists(id=exclude_user_id, email=email))
 
-    def get_all_users(self):
-        """Return list of all users"""
-        return self.user_repo.get_all() #all:method from InMemoryRepository that returns all stored objects
+    def get_all_users(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """Return one page of users (public fields only) and the cursor for the next page"""
+        return self.user_repo.get_page(after=after, limit=limit,
+                                       columns=("id", "first_name", "last_name", "email"))
     
     def update_user(self, user_id, user_data):
         """
@@ -58,8 +94,7 @@ class HBnBFacade: #new class for facade
 
         # Check if new email is already used
         if user.email != user_data['email']:
-            existing = self.get_user_by_email(user_data['email'])
-            if existing and existing.id != user.id:
+            if self.email_taken(user_data['email'], exclude_user_id=user.id):
                 raise ValueError("Email already registered")
 
         # Update user fields
@@ -77,6 +112,15 @@ class HBnBFacade: #new class for facade
         self.amenity_repo.add(amenity) #stores the object inside the fake database
         return amenity
 
+    def create_amenities_bulk(self, amenities_data):
+        """
+        Creates many amenities with batched inserts.
+        Returns the list of created Amenity objects.
+        """
+        amenities = [Amenity(**amenity_data) for amenity_data in amenities_data]
+        self.amenity_repo.add_many(amenities)
+        return amenities
+
     def get_amenity(self, amenity_id):
         """
         Retrieves a single amenity by its unique ID.
@@ -84,11 +128,11 @@ class HBnBFacade: #new class for facade
         """
         return self.amenity_repo.get(amenity_id)
 
-    def get_all_amenities(self):
+    def get_all_amenities(self, after=None, limit=DEFAULT_PAGE_SIZE):
         """
-        Returns a list of all Amenity objects currently stored.
+        Returns one page of amenity (id, name) rows and the cursor for the next page.
         """
-        return self.amenity_repo.get_all()
+        return self.amenity_repo.get_page(after=after, limit=limit, columns=("id", "name"))
 
     def update_amenity(self, amenity_id, amenity_data):
         """
@@ -119,12 +163,7 @@ class HBnBFacade: #new class for facade
             raise ValueError("Owner not found")
 
         # Validate amenities
-        amenities = []
-        for amenity_id in place_data.get("amenities", []):
-            amenity = self.amenity_repo.get(amenity_id)
-            if not amenity:
-                raise ValueError(f"Amenity ID {amenity_id} not found")
-            amenities.append(amenity)
+        amenities = self._get_amenities(place_data.get("amenities", []))
 
         # Build Place (this will auto-validate title, price, lat/lng)
         place = Place(
@@ -133,23 +172,52 @@ class HBnBFacade: #new class for facade
             price=place_data["price"],
             latitude=place_data["latitude"],
             longitude=place_data["longitude"],
-            owner=owner
+            owner=owner,
+            owner_id=owner.id
         )
 
         # Add amenities to place
-        for amenity in amenities:
-            place.add_amenity(amenity)
+        place.amenities = amenities
 
         # Save to memory
         self.place_repo.add(place)
         return place
 
 
-    def get_place(self, place_id):
+    def _get_amenities(self, amenity_ids):
+        """
+        Resolves a list of amenity IDs with a single lookup.
+        Raises ValueError naming the first unknown ID.
+        """
+        amenities, missing = self.amenity_repo.get_many(amenity_ids)
+        if missing:
+            raise ValueError(f"Amenity ID {missing[0]} not found")
+        return amenities
+
+    def get_place(self, place_id, reviews=0):
         """
         Retrieves a place by ID, including owner and amenities.
         Returns None if not found.
-        """
+        With the repository cache on, the result is served from the cache
+        until any place, user or amenity is written. A session with
+        uncommitted changes (e.g. update_place earlier in the same unit of
+        work) bypasses the cache both ways: it must see its own changes,
+        and they must not be cached before they commit.
+        With reviews=N the first page of its N newest reviews is added
+        (see get_reviews_by_place), as "reviews" and "reviews_next_cursor".
+        """
+        cache = get_cache()
+        if cache is not None and has_uncommitted_writes(db.session):
+            cache = None
+        if cache is not None:
+            key = cache_key('place_detail', place_id)
+            # read the generations first: a write racing with the build
+            # below leaves the entry stamped as stale
+            stamp = tuple(table_generation(cache, table) for table in ('users', 'amenities', 'places'))
+            entry = cache.get(key)
+            if entry is not None and entry[0] == stamp:
+                return self._with_reviews(dict(entry[1]), reviews)
+
         place = self.place_repo.get(place_id)
         if not place:
             return None
@@ -169,7 +237,7 @@ class HBnBFacade: #new class for facade
                 "name": amenity.name
             })
 
-        return {
+        place_data = {
             "id": place.id,
             "title": place.title,
             "description": place.description,
@@ -179,12 +247,28 @@ class HBnBFacade: #new class for facade
             "owner": owner_data,
             "amenities": amenities_data
         }
-
-    def get_all_places(self):
-        """
-        Retrieves a list of all places with basic location info.
-        """
-        places = self.place_repo.get_all()
+        if cache is not None:
+            cache.set(key, (stamp, place_data))
+            place_data = dict(place_data)
+        return self._with_reviews(place_data, reviews)
+
+    def _with_reviews(self, place_data, limit):
+        # reviews are read fresh, never cached with the place: they change
+        # far more often than the place, its owner or its amenities
+        if limit:
+            reviews, next_cursor = self._place_reviews(place_data["id"], limit=limit)
+            place_data["reviews"] = reviews
+            place_data["reviews_next_cursor"] = next_cursor
+        return place_data
+
+    def get_all_places(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Retrieves one page of places with basic location info,
+        plus the cursor for the next page.
+        """
+        places, next_cursor = self.place_repo.get_page(
+            after=after, limit=limit,
+            columns=("id", "title", "price", "latitude", "longitude"))
         return [
             {
                 "id": place.id,
@@ -194,7 +278,7 @@ class HBnBFacade: #new class for facade
                 "longitude": place.longitude
             }
             for place in places
-        ]
+        ], next_cursor
 
 
     def update_place(self, place_id, place_data):
@@ -228,13 +312,7 @@ class HBnBFacade: #new class for facade
 
         # Validate and update amenities
         if "amenities" in place_data:
-            new_amenities = []
-            for amenity_id in place_data["amenities"]:
-                amenity = self.amenity_repo.get(amenity_id)
-                if not amenity:
-                    raise ValueError(f"Amenity ID {amenity_id} not found")
-                new_amenities.append(amenity)
-            place.amenities = new_amenities
+            place.amenities = self._get_amenities(place_data["amenities"])
 
         return place
 
@@ -242,21 +320,10 @@ class HBnBFacade: #new class for facade
         """
         Creates a Review object after validating user, place, and rating.
         """
-        # Check required fields
-        text = review_data.get("text")
-        rating = review_data.get("rating")
+        text, rating = self._validate_review_fields(review_data)
         user_id = review_data.get("user_id")
         place_id = review_data.get("place_id")
 
-        if not text or not isinstance(text, str):
-            raise ValueError("Review text must be a non-empty string")
-
-        # Coerce numeric strings to int
-        if isinstance(rating, str):
-            rating = int(rating) if rating.isdigit() else rating
-        if not isinstance(rating, int) or not (1 <= rating <= 5):
-            raise ValueError("Rating must be an integer between 1 and 5")
-
         user = self.user_repo.get(user_id)
         if not user:
             raise ValueError("User not found")
@@ -265,61 +332,163 @@ class HBnBFacade: #new class for facade
         if not place:
             raise ValueError("Place not found")
 
+        if self.has_reviewed(user_id, place_id):
+            raise ValueError("You have already reviewed this place.")
+
         # Create review
-        review = Review(text=text.strip(), rating=rating, user=user, place=place)
+        # set the foreign keys too: the relationships only fill them in at flush,
+        # which a unit of work defers until the end of the request
+        review = Review(text=text, rating=rating, user=user, place=place,
+                        user_id=user.id, place_id=place.id)
         self.review_repo.add(review)
         return review
 
-    def get_review(self, review_id):
+    def _validate_review_fields(self, review_data):
         """
-        Retrieves a single review by its ID.
-        Returns None if not found.
+        Checks text and rating of a review payload.
+        Returns the cleaned (text, rating).
         """
-        review = self.review_repo.get(review_id)
-        if not review:
-            return None
+        text = review_data.get("text")
+        rating = review_data.get("rating")
 
-        # Fetch user for display name
-        user = self.user_repo.get(review.user_id)
-        user_name = f"{user.first_name} {user.last_name}" if user else ""
+        if not text or not isinstance(text, str) or not text.strip():
+            raise ValueError("Review text must be a non-empty string")
+
+        # Coerce numeric strings to int
+        if isinstance(rating, str):
+            rating = int(rating) if rating.isdigit() else rating
+        if not isinstance(rating, int) or not (1 <= rating <= 5):
+            raise ValueError("Rating must be an integer between 1 and 5")
+
+        return text.strip(), rating
+
+    def create_reviews_bulk(self, reviews_data):
+        """
+        Creates many reviews at once for imports and seeding.
+        Every payload is validated before anything is written, including
+        against the (user_id, place_id) pairs already reviewed, then rows are
+        inserted in chunks with a single commit each.
+        Returns the list of created Review objects.
+        """
+        _, missing = self.user_repo.get_many(r.get("user_id") for r in reviews_data)
+        missing_users = set(missing)
+        _, missing = self.place_repo.get_many(r.get("place_id") for r in reviews_data)
+        missing_places = set(missing)
+
+        reviews = []
+        seen_pairs = {}  # (user_id, place_id) -> payload index
+        for index, review_data in enumerate(reviews_data):
+            try:
+                text, rating = self._validate_review_fields(review_data)
+            except ValueError as e:
+                raise ValueError(f"Review #{index}: {e}")
+
+            user_id = review_data.get("user_id")
+            if user_id in missing_users:
+                raise ValueError(f"Review #{index}: User not found")
+
+            place_id = review_data.get("place_id")
+            if place_id in missing_places:
+                raise ValueError(f"Review #{index}: Place not found")
+
+            # reviews are unique per (user_id, place_id)
+            if (user_id, place_id) in seen_pairs:
+                raise ValueError(f"Review #{index}: Duplicate review for this user and place")
+            seen_pairs[(user_id, place_id)] = index
+
+            reviews.append(Review(text=text, rating=rating, user_id=user_id, place_id=place_id))
+
+        # one SELECT per chunk of pairs, a row-value IN on uq_reviews_user_place
+        pairs = list(seen_pairs)
+        for start in range(0, len(pairs), BULK_CHUNK_SIZE):
+            rows = self.review_repo.select_where(
+                {("user_id", "place_id"): pairs[start:start + BULK_CHUNK_SIZE]},
+                ("user_id", "place_id"))
+            for row in rows:
+                index = seen_pairs[(row.user_id, row.place_id)]
+                raise ValueError(f"Review #{index}: User has already reviewed this place")
+
+        self.review_repo.add_many(reviews)
+        return reviews
+
+    def update_reviews_bulk(self, updates):
+        """
+        Applies {review_id: {"text": ..., "rating": ...}} in batched writes.
+        Returns the number of reviews updated.
+        """
+        values = {}
+        for review_id, review_data in updates.items():
+            data = {}
+            if "text" in review_data:
+                text = review_data["text"]
+                if not isinstance(text, str) or not text.strip():
+                    raise ValueError(f"Review {review_id}: Review text must be a non-empty string")
+                data["text"] = text.strip()
+            if "rating" in review_data:
+                rating = review_data["rating"]
+                if not isinstance(rating, int) or not (1 <= rating <= 5):
+                    raise ValueError(f"Review {review_id}: Rating must be an integer between 1 and 5")
+                data["rating"] = rating
+            if data:
+                values[review_id] = data
+        return self.review_repo.update_many(values)
+
+    def delete_reviews_bulk(self, review_ids):
+        """
+        Deletes many reviews by ID in batched writes.
+        Returns the number of reviews deleted.
+        """
+        return self.review_repo.delete_many(review_ids)
+
+    def _review_dict(self, review, user):
         return {
             "id": review.id,
             "text": review.text,
             "rating": review.rating,
             "user_id": review.user_id,
-            "user_name": user_name,
+            "user_name": f"{user.first_name} {user.last_name}" if user else "",
             "place_id": review.place_id
         }
 
-    def get_all_reviews(self):
-        """
-        Returns a list of all reviews with basic information.
-        """
-        reviews = self.review_repo.get_all()
-        out = []
-        for review in reviews:
-            user = self.user_repo.get(review.user_id)
-            user_name = f"{user.first_name} {user.last_name}" if user else ""
-            out.append({
-                "id": review.id,
-                "text": review.text,
-                "rating": review.rating,
-                "user_id": review.user_id,
-                "user_name": user_name,
-                "place_id": review.place_id
-            })
-        return out
+    def get_review(self, review_id):
+        """
+        Retrieves a single review by its ID.
+        Returns None if not found.
+        """
+        review = self.review_repo.get(review_id)
+        if not review:
+            return None
+
+        # Fetch user for display name
+        return self._review_dict(review, self.user_repo.get(review.user_id))
+
+    def get_all_reviews(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Returns one page of reviews with basic information,
+        plus the cursor for the next page.
+        Author names come from the same query (JOIN users), so a page
+        costs one statement whatever its size.
+        """
+        reviews, next_cursor = self.review_repo.get_page(
+            after=after, limit=limit, options=(review_author(),))
+        return [self._review_dict(review, review.user) for review in reviews], next_cursor
+
+    def has_reviewed(self, user_id, place_id):
+        """
+        True if the user already reviewed the place.
+        An EXISTS query on the unique (user_id, place_id) index.
+        """
+        return self.review_repo.exists(user_id=user_id, place_id=place_id)
 
     def get_review_by_user_and_place(self, user_id, place_id):
         """
         Returns a review if the user has already reviewed the given place.
         Otherwise returns None
+        A WHERE user_id = ? AND place_id = ? lookup on uq_reviews_user_place.
         """
-        reviews = self.review_repo.get_all()
-        for review in reviews:
-            if review.user_id == user_id and review.place_id == place_id:
-                return review
-        return None
+        reviews, _ = self.review_repo.get_page(
+            limit=1, filters={"user_id": user_id, "place_id": place_id})
+        return reviews[0] if reviews else None
 
     def update_review(self, review_id, review_data):
         """
@@ -356,33 +525,27 @@ class HBnBFacade: #new class for facade
         Deletes a review by ID.
         Returns True if successful, False if not found.
         """
-        review = self.review_repo.get(review_id)
-        if not review:
-            return False
+        return self.review_repo.delete_where({"id": review_id}) > 0
 
-        self.review_repo.delete(review_id)
-        return True
-
-    def get_reviews_by_place(self, place_id):
+    def get_reviews_by_place(self, place_id, after=None, limit=DEFAULT_PAGE_SIZE, sort='newest'):
         """
-        Returns a list of all reviews for a specific place.
+        Returns one page of the reviews of a place, plus the cursor for the
+        next page, or None if the place does not exist.
+        sort is one of REVIEW_SORTS; a cursor only continues its own sort.
         """
-        place = self.place_repo.get(place_id)
-        if not place:
+        if not self.place_repo.exists(id=place_id):
             return None  # Place not found
+        return self._place_reviews(place_id, after, limit, sort)
 
-        reviews = self.review_repo.get_all()
-        out = []
-        for review in reviews:
-            if review.place_id != place_id:
-                continue
-            user = self.user_repo.get(review.user_id)
-            user_name = f"{user.first_name} {user.last_name}" if user else ""
-            out.append({
-                "id": review.id,
-                "text": review.text,
-                "rating": review.rating,
-                "user_id": review.user_id,
-                "user_name": user_name
-            })
-        return out
+    def _place_reviews(self, place_id, after=None, limit=DEFAULT_PAGE_SIZE, sort='newest'):
+        """
+        One keyset page of WHERE place_id = ? read in order off
+        idx_reviews_place_created_id / idx_reviews_place_rating_id,
+        author names joined in.
+        """
+        if sort not in REVIEW_SORTS:
+            raise ValueError(f"sort must be one of: {', '.join(REVIEW_SORTS)}")
+        reviews, next_cursor = self.review_repo.get_page(
+            after=after, limit=limit, order_by=REVIEW_SORTS[sort],
+            options=(review_author(),), filters={"place_id": place_id})
+        return [self._review_dict(review, review.user) for review in reviews], next_cursor
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+"""
+Slow query log.
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS are logged with their
+parameters, the facade method that issued them and, on SQLite, the output
+of EXPLAIN QUERY PLAN run on the same connection, so full scans
+("SCAN reviews") show up straight away. Values bound to REDACTED_COLUMNS
+are masked in the log.
+"""
+
+import re
+import sys
+import time
+from sqlalchemy import event
+from app import db
+
+FACADE_MODULES = ('app.services.facade', 'app.services.async_facade')
+# kept on the statement's ExecutionContext, which a failed statement drops
+START_ATTRIBUTE = '_hbnb_slow_query_start'
+# bound values of these columns (password hashes, addresses) never reach the log
+REDACTED_COLUMNS = frozenset({'password', 'email'})
+REDACTED = '<redacted>'
+
+
+def calling_facade_method():
+    """Name of the innermost facade method on the current call stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get('__name__') in FACADE_MODULES:
+            owner = frame.f_locals.get('self')
+            name = frame.f_code.co_name
+            return f"{type(owner).__name__}.{name}" if owner is not None else name
+        frame = frame.f_back
+    return "<outside facade>"
+
+
+def _parameter_names(context):
+    """
+    Bind names in the order of a positional parameter tuple, with IN lists
+    expanded like the executed statement, or None if they are unknown.
+    """
+    positiontup = getattr(getattr(context, 'compiled', None), 'positiontup', None)
+    if positiontup is None:
+        return None
+    expanded = getattr(context, '_expanded_parameters', None) or {}
+    names = []
+    for name in positiontup:
+        names.extend(expanded.get(name, (name,)))
+    return names
+
+
+def _is_redacted(name):
+    # bind names are the column key plus numeric suffixes: email_1, email_1_2
+    return re.sub(r'(_\d+)+$', '', name) in REDACTED_COLUMNS
+
+
+def redact_parameters(context, parameters, executemany=False):
+    """
+    Copy of the statement parameters with the values bound to
+    REDACTED_COLUMNS replaced by REDACTED. Positional parameters whose
+    names cannot be recovered are all redacted.
+    """
+    if executemany:
+        return [redact_parameters(context, row) for row in parameters]
+    if isinstance(parameters, dict):
+        return {name: REDACTED if _is_redacted(name) else value
+                for name, value in parameters.items()}
+    if getattr(context, 'compiled', None) is None:
+        return parameters  # plain SQL string: no bind names to go by
+    names = _parameter_names(context)
+    if names is None or len(names) != len(parameters):
+        return tuple(REDACTED for _ in parameters)
+    return tuple(REDACTED if _is_redacted(name) else value
+                 for name, value in zip(names, parameters))
+
+
+def explain_query_plan(cursor, statement, parameters, executemany=False):
+    """
+    Runs EXPLAIN QUERY PLAN for a statement on the DBAPI connection that
+    just executed it. Returns the plan as indented lines.
+    """
+    if executemany:
+        parameters = parameters[0] if parameters else ()
+    plan_cursor = cursor.connection.cursor()
+    try:
+        plan_cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+        rows = plan_cursor.fetchall()
+    finally:
+        plan_cursor.close()
+
+    depth = {0: 0}
+    lines = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, 0) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+def init_app(app):
+    """Logs statements above SLOW_QUERY_THRESHOLD_MS (unset disables it)."""
+    threshold_ms = app.config.get('SLOW_QUERY_THRESHOLD_MS')
+    if threshold_ms in (None, ''):
+        return
+    threshold = float(threshold_ms) / 1000
+
+    with app.app_context():
+        engine = db.engine
+    explain = engine.dialect.name == 'sqlite'
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            setattr(context, START_ATTRIBUTE, time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, START_ATTRIBUTE, None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        if elapsed < threshold:
+            return
+
+        plan = []
+        if explain:
+            try:
+                plan = explain_query_plan(cursor, statement, parameters, executemany)
+            except Exception as e:  # the plan is best effort, never fail the query
+                plan = [f"<EXPLAIN QUERY PLAN failed: {e}>"]
+
+        app.logger.warning(
+            "Slow query (%.1f ms) from %s\n%s\nparameters: %r\nquery plan:\n%s",
+            elapsed * 1000, calling_facade_method(), statement,
+            redact_parameters(context, parameters, executemany),
+            "\n".join(plan) or "  <not available>")
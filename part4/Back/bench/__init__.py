@@ -0,0 +1,5 @@
+"""
+Benchmarks for the Part 4 backend, run from part4/Back as modules:
+
+    python -m bench.<name> --help
+"""
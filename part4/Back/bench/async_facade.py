@@ -0,0 +1,152 @@
+#!/usr/bin/python3
+"""
+Requests/s of AsyncHBnBFacade against the sync facade at high concurrency.
+
+Each simulated request reads one place detail and its first page of
+reviews. The sync side runs one thread per client, each with its own
+scoped session, as a threaded WSGI server would; the async side runs one
+task per client on a single event loop. Both share the same file
+database, SQLite pragmas and connection pool size, so the comparison is
+thread-per-request against awaiting the driver. aiosqlite runs each
+statement on a helper thread, so on SQLite the async path pays a hop per
+query that a network database driver (asyncpg, aiomysql) does not.
+
+    python -m bench.async_facade --clients 100 --pool 10 --seconds 5
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services import facade
+from app.services.async_facade import AsyncHBnBFacade
+from config import ProductionConfig
+
+PLACES = 200
+REVIEWS_PER_PLACE = 20
+REVIEW_PAGE = 10
+
+
+def make_config(database_uri, pool):
+    class BenchConfig(ProductionConfig):
+        SQLALCHEMY_DATABASE_URI = database_uri
+        SQLALCHEMY_ENGINE_OPTIONS = dict(ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS,
+                                         pool_size=pool, max_overflow=0, pool_timeout=60)
+        # measure the database path, not the repository cache
+        REPOSITORY_CACHE = None
+        SQL_METRICS = False
+    return BenchConfig
+
+
+def seed(app):
+    with app.app_context():
+        users = [User(first_name=f'First{i}', last_name=f'Last{i}',
+                      email=f'user{i}@bench.test', password='password123')
+                 for i in range(REVIEWS_PER_PLACE)]
+        db.session.add_all(users)
+        amenities = [Amenity(name=f'Amenity {i}') for i in range(5)]
+        db.session.add_all(amenities)
+        db.session.flush()
+        places = []
+        for i in range(PLACES):
+            place = Place(title=f'Place {i}', description='', price=50.0 + i,
+                          latitude=0.0, longitude=0.0, owner_id=users[0].id)
+            place.amenities.extend(amenities)
+            places.append(place)
+        db.session.add_all(places)
+        db.session.flush()
+        db.session.add_all(Review(text='Nice', rating=1 + n % 5, user_id=user.id, place_id=place.id)
+                           for place in places for n, user in enumerate(users))
+        db.session.commit()
+        return [place.id for place in places]
+
+
+def run_sync(app, place_ids, clients, seconds):
+    counts = []
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def client(n):
+        done = 0
+        while not stop.is_set():
+            place_id = place_ids[(n + done) % len(place_ids)]
+            with app.app_context():
+                facade.get_place(place_id)
+                facade.get_reviews_by_place(place_id, limit=REVIEW_PAGE)
+                db.session.remove()
+            done += 1
+        with lock:
+            counts.append(done)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    # requests in flight at the deadline still finish: count their time too
+    return sum(counts) / (time.perf_counter() - start)
+
+
+async def run_async(async_facade, place_ids, clients, seconds):
+    deadline = time.monotonic() + seconds
+
+    async def client(n):
+        done = 0
+        while time.monotonic() < deadline:
+            place_id = place_ids[(n + done) % len(place_ids)]
+            await async_facade.get_place(place_id)
+            await async_facade.get_reviews_by_place(place_id, limit=REVIEW_PAGE)
+            done += 1
+        return done
+
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(client(n) for n in range(clients)))
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=100, help='concurrent connections')
+    parser.add_argument('--pool', type=int, default=10, help='database connections')
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        app = create_app(make_config(uri, args.pool))
+        place_ids = seed(app)
+
+        sync_rate = run_sync(app, place_ids, args.clients, args.seconds)
+        with app.app_context():
+            db.engine.dispose()
+
+        async_facade = AsyncHBnBFacade.from_app(app, pool_size=args.pool, max_overflow=0,
+                                                pool_timeout=60)
+
+        async def measure():
+            try:
+                return await run_async(async_facade, place_ids, args.clients, args.seconds)
+            finally:
+                await async_facade.place_repo.session_factory.kw['bind'].dispose()
+
+        async_rate = asyncio.run(measure())
+
+    print(f"{args.clients} clients, {args.pool} connections, {args.seconds:g}s each")
+    print(f"{'path':<8}{'req/s':>10}")
+    print(f"{'sync':<8}{sync_rate:>10.0f}")
+    print(f"{'async':<8}{async_rate:>10.0f}")
+    print(f"async/sync: x{async_rate / max(sync_rate, 1e-9):.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""
+Per-call cost of the hot facade lookups, before and after prebuilt statements.
+
+"before" swaps the repositories' get_by_attribute and get back to the
+query-per-call versions they replaced (Query.filter_by(...).first() and
+the legacy Query.get()); "after" runs the current code. Each call starts
+from an empty identity map, as a new request would, and the repository
+cache is off so every call reaches the database.
+
+    python -m bench.hot_lookups --calls 2000
+"""
+
+import argparse
+import time
+import warnings
+from contextlib import contextmanager
+from sqlalchemy.exc import LegacyAPIWarning
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.user import User
+from app.services import facade
+from config import DevelopmentConfig
+
+USERS = 1000
+
+
+class BenchConfig(DevelopmentConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    REPOSITORY_CACHE = None
+    SQL_METRICS = False
+
+
+def seed():
+    users = [User(first_name=f'First{i}', last_name=f'Last{i}', email=f'user{i}@bench.test',
+                  password='password123')
+             for i in range(USERS)]
+    db.session.add_all(users)
+    amenities = [Amenity(name=f'Amenity {i}') for i in range(5)]
+    db.session.add_all(amenities)
+    db.session.flush()
+    place = Place(title='Loft', description='', price=80.0, latitude=0.0, longitude=0.0,
+                  owner_id=users[-1].id)
+    place.amenities.extend(amenities)
+    db.session.add(place)
+    db.session.commit()
+    return users[-1].email, users[-1].id, place.id
+
+
+@contextmanager
+def legacy_lookups():
+    """Puts the query-per-call repository lookups back on the facade."""
+    repos = (facade.user_repo, facade.place_repo)
+
+    def patch(repo):
+        model = repo.model
+        repo.get_by_attribute = lambda attr, value: model.query.filter_by(**{attr: value}).first()
+        repo.get = lambda obj_id: model.query.get(obj_id)
+
+    for repo in repos:
+        patch(repo)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LegacyAPIWarning)  # Query.get() is the point
+            yield
+    finally:
+        for repo in repos:
+            del repo.get_by_attribute, repo.get
+
+
+def per_call_us(call, calls):
+    call()  # warm up: compile and cache the statement
+    total = 0.0
+    for _ in range(calls):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        call()
+        total += time.perf_counter() - start
+    return total / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=2000)
+    args = parser.parse_args()
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        email, owner_id, place_id = seed()
+        cases = (
+            ('login (get_user_by_email)', lambda: facade.get_user_by_email(email)),
+            ('get_by_attribute(owner_id)',
+             lambda: facade.place_repo.get_by_attribute('owner_id', owner_id)),
+            ('place detail (get_place)', lambda: facade.get_place(place_id)),
+        )
+        print(f"{'lookup':<30}{'before us':>11}{'after us':>10}{'speedup':>9}")
+        for name, call in cases:
+            with legacy_lookups():
+                before = per_call_us(call, args.calls)
+            after = per_call_us(call, args.calls)
+            print(f"{name:<30}{before:>11.0f}{after:>10.0f}{before / after:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""
+Read/write concurrency of ProductionConfig against the default SQLite setup.
+
+Reader threads fetch place details and amenity pages while writer threads
+create amenities, all through the Flask test client against the same file
+database. The baseline uses SQLite's rollback journal and SQLAlchemy's
+default pool, so readers and writers take turns on the database lock;
+ProductionConfig runs in WAL mode with the tuned pragmas and pool.
+
+    python -m bench.production_config --readers 4 --writers 2 --seconds 5
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.user import User
+from config import Config, ProductionConfig
+
+PLACES = 200
+
+
+def make_config(base, database_uri, threads):
+    class BenchConfig(base):
+        SQLALCHEMY_DATABASE_URI = database_uri
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        # measure the database, not the repository cache
+        REPOSITORY_CACHE = None
+        SQL_METRICS = False
+    if hasattr(base, 'SQLALCHEMY_ENGINE_OPTIONS'):
+        # one connection per thread, as GUNICORN_THREADS does in deployment
+        BenchConfig.SQLALCHEMY_ENGINE_OPTIONS = dict(base.SQLALCHEMY_ENGINE_OPTIONS,
+                                                     pool_size=threads)
+    BenchConfig.__name__ = base.__name__
+    return BenchConfig
+
+
+def seed(app):
+    with app.app_context():
+        owner = User(first_name='Bench', last_name='Owner', email='owner@bench.test',
+                     password='password123')
+        db.session.add(owner)
+        db.session.flush()
+        places = [Place(title=f'Place {i}', description='', price=50.0 + i,
+                        latitude=0.0, longitude=0.0, owner_id=owner.id)
+                  for i in range(PLACES)]
+        db.session.add_all(places)
+        db.session.add_all(Amenity(name=f'Seed {i}') for i in range(50))
+        db.session.commit()
+        return [place.id for place in places]
+
+
+def run(config_class, readers, writers, seconds):
+    """Reads/s, writes/s and failed requests for one configuration."""
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        app = create_app(make_config(config_class, uri, readers + writers))
+        place_ids = seed(app)
+        counts = {'read': 0, 'write': 0, 'failed': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def reader(n):
+            client = app.test_client()
+            done = failed = 0
+            i = n
+            while not stop.is_set():
+                i += 1
+                if i % 2:
+                    res = client.get(f'/api/v1/places/{place_ids[i % len(place_ids)]}')
+                else:
+                    res = client.get('/api/v1/amenities/?limit=20')
+                if res.status_code == 200:
+                    done += 1
+                else:
+                    failed += 1
+            with lock:
+                counts['read'] += done
+                counts['failed'] += failed
+
+        def writer(n):
+            client = app.test_client()
+            done = failed = 0
+            while not stop.is_set():
+                res = client.post('/api/v1/amenities/',
+                                  json={'name': f'Amenity {n}-{done + failed}'})
+                if res.status_code == 201:
+                    done += 1
+                else:
+                    failed += 1
+            with lock:
+                counts['write'] += done
+                counts['failed'] += failed
+
+        threads = ([threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+                   + [threading.Thread(target=writer, args=(n,)) for n in range(writers)])
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        return counts['read'] / seconds, counts['write'] / seconds, counts['failed']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s each")
+    print(f"{'config':<18}{'reads/s':>10}{'writes/s':>10}{'failed':>8}")
+    results = {}
+    for config_class in (Config, ProductionConfig):
+        reads, writes, failed = run(config_class, args.readers, args.writers, args.seconds)
+        results[config_class.__name__] = (reads, writes)
+        print(f"{config_class.__name__:<18}{reads:>10.0f}{writes:>10.0f}{failed:>8}")
+    base, prod = results['Config'], results['ProductionConfig']
+    print(f"gain: reads x{prod[0] / max(base[0], 1e-9):.2f}, writes x{prod[1] / max(base[1], 1e-9):.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+-- indexes.sql
+-- Secondary indexes declared on the models. Safe to re-run on an existing
+-- database; the app also creates missing ones at startup (ensure_indexes).
+
+-- PLACES
+CREATE INDEX IF NOT EXISTS idx_places_owner_id ON places(owner_id);
+CREATE INDEX IF NOT EXISTS idx_places_price ON places(price);
+CREATE INDEX IF NOT EXISTS idx_places_location ON places(latitude, longitude);
+
+-- REVIEWS
+-- fails if duplicate (user_id, place_id) rows exist; remove them first
+CREATE UNIQUE INDEX IF NOT EXISTS uq_reviews_user_place ON reviews(user_id, place_id);
+CREATE INDEX IF NOT EXISTS idx_reviews_place_created_id ON reviews(place_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reviews_place_rating_id ON reviews(place_id, rating, id);
+-- superseded by idx_reviews_place_rating_id
+DROP INDEX IF EXISTS idx_reviews_place_rating;
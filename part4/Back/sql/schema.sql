@@ -48,3 +48,9 @@ CREATE TABLE IF NOT EXISTS reviews (
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     UNIQUE (user_id, place_id)
 );
+
+-- INDEXES
+CREATE INDEX IF NOT EXISTS idx_places_owner_id ON places(owner_id);
+CREATE INDEX IF NOT EXISTS idx_places_price ON places(price);
+CREATE INDEX IF NOT EXISTS idx_places_location ON places(latitude, longitude);
+CREATE INDEX IF NOT EXISTS idx_reviews_place_rating_id ON reviews(place_id, rating, id);
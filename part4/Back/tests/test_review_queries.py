@@ -0,0 +1,88 @@
+"""
+Query-count regression tests for the review listings.
+
+A page of reviews, with each author's name, must cost the same number of
+SQL statements whatever its size: no per-review author lookups (N+1).
+"""
+
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services import facade
+from config import DevelopmentConfig
+
+REVIEW_COUNT = 60
+PAGE_SIZES = (5, 50)
+
+
+class TestConfig(DevelopmentConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    REPOSITORY_CACHE = None
+    SQL_METRICS = False
+
+
+class TestReviewQueryCounts(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.context = self.app.app_context()
+        self.context.push()
+        owner = User(first_name='Owner', last_name='Host', email='owner@example.com',
+                     password='password123')
+        authors = [User(first_name=f'First{i}', last_name=f'Last{i}',
+                        email=f'author{i}@example.com', password='password123')
+                   for i in range(REVIEW_COUNT)]
+        db.session.add_all([owner, *authors])
+        db.session.flush()
+        place = Place(title='Loft', description='', price=80.0, latitude=10.0,
+                      longitude=20.0, owner_id=owner.id)
+        db.session.add(place)
+        db.session.flush()
+        db.session.add_all([Review(text='Great stay', rating=1 + i % 5,
+                                   user_id=author.id, place_id=place.id)
+                            for i, author in enumerate(authors)])
+        db.session.commit()
+        self.place_id = place.id
+
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _queries(self, call):
+        """Statements issued by call() on a fresh session, and its result."""
+        db.session.expunge_all()
+        self.statements.clear()
+        result = call()
+        return len(self.statements), result
+
+    def _assert_constant(self, call):
+        counts = {}
+        for limit in PAGE_SIZES:
+            counts[limit], (reviews, _) = self._queries(lambda: call(limit))
+            self.assertEqual(len(reviews), limit)
+            for review in reviews:
+                self.assertRegex(review['user_name'], r'^First\d+ Last\d+$')
+        self.assertEqual(len(set(counts.values())), 1, f"queries per page size: {counts}")
+
+    def test_get_all_reviews_query_count_is_constant(self):
+        self._assert_constant(lambda limit: facade.get_all_reviews(limit=limit))
+
+    def test_get_reviews_by_place_query_count_is_constant(self):
+        for sort in ('newest', 'rating'):
+            with self.subTest(sort=sort):
+                self._assert_constant(lambda limit: facade.get_reviews_by_place(
+                    self.place_id, limit=limit, sort=sort))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,14 +36,27 @@ async function loginUser(email, password) {
 
 // 2) FETCHERS & RENDERS
 
+// List endpoints are cursor-paginated: keep passing the X-Next-Cursor
+// response header back as ?cursor= until the server stops sending it
+async function fetchAllPages(url, errorMessage) {
+  const token = getCookie('token');
+  const items = [];
+  let cursor = null;
+  do {
+    const pageUrl = cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url;
+    const res = await fetch(pageUrl, {
+      headers: { 'Authorization': `Bearer ${token}` }
+    });
+    if (!res.ok) throw new Error(errorMessage);
+    items.push(...await res.json());
+    cursor = res.headers.get('X-Next-Cursor');
+  } while (cursor);
+  return items;
+}
+
 // Fetch and render the list of places (index.html)
 async function fetchPlaces() {
-  const token = getCookie('token');
-  const res = await fetch(`${API_BASE}/places/`, {
-    headers: { 'Authorization': `Bearer ${token}` }
-  });
-  if (!res.ok) throw new Error('Failed to fetch places');
-  const places = await res.json();
+  const places = await fetchAllPages(`${API_BASE}/places/`, 'Failed to fetch places');
   displayPlaces(places);
 }
 
@@ -103,42 +116,80 @@ function displayPlaceDetails(place) {
     addSection.style.display = token ? 'block' : 'none';
     if (token) addSection.querySelector('a').href = `add_review.html?id=${place.id}`;
   }
-  fetchReviews(place.id);
+  // The detail response embeds the newest reviews; later pages load on demand
+  if (Array.isArray(place.reviews)) {
+    displayReviews(place.reviews);
+    showMoreReviews(place.id, place.reviews_next_cursor);
+  } else {
+    fetchReviews(place.id).catch(e => console.error(e));
+  }
 }
 
 // Fetch & render reviews for a place
 async function fetchReviews(placeId) {
+  const reviews = await fetchAllPages(
+    `${API_BASE}/reviews/place/${placeId}`, 'Failed to fetch reviews'
+  );
+  displayReviews(reviews);
+}
+
+// Fetch the page of reviews after `cursor` and append it (place.html)
+async function loadMoreReviews(placeId, cursor) {
   const token = getCookie('token');
   const res = await fetch(
-    `${API_BASE}/reviews/place/${placeId}`, {
+    `${API_BASE}/reviews/place/${placeId}?cursor=${encodeURIComponent(cursor)}`, {
       headers: { 'Authorization': `Bearer ${token}` }
     }
   );
   if (!res.ok) throw new Error('Failed to fetch reviews');
   const reviews = await res.json();
-  displayReviews(reviews);
+  const container = document.getElementById('reviews');
+  if (container) container.insertAdjacentHTML('beforeend', reviews.map(reviewCard).join(''));
+  showMoreReviews(placeId, res.headers.get('X-Next-Cursor'));
 }
-function displayReviews(reviews) {
+
+// "More reviews" button under the list while another page exists
+function showMoreReviews(placeId, cursor) {
   const container = document.getElementById('reviews');
   if (!container) return;
-  container.innerHTML = reviews.length
-    ? reviews.map(r => {
-        const name = (r.user_name && String(r.user_name).trim())
-          ? String(r.user_name).trim()
-          : null;
-        let by;
-        if (name) {
-          by = `"${name}"`;
-        } else {
-          const rate = Number(r.rating);
-          by = rate <= 3 ? 'Unsatisfied customer' : 'Satisfied customer';
-        }
-        return `
+  let more = document.getElementById('more-reviews');
+  if (!cursor) {
+    if (more) more.remove();
+    return;
+  }
+  if (!more) {
+    more = document.createElement('div');
+    more.id = 'more-reviews';
+    more.className = 'more-reviews';
+    more.innerHTML = '<button type="button" class="details-button">More reviews</button>';
+    container.after(more);
+  }
+  more.querySelector('button').onclick = () =>
+    loadMoreReviews(placeId, cursor).catch(e => console.error(e));
+}
+
+function reviewCard(r) {
+  const name = (r.user_name && String(r.user_name).trim())
+    ? String(r.user_name).trim()
+    : null;
+  let by;
+  if (name) {
+    by = `"${name}"`;
+  } else {
+    const rate = Number(r.rating);
+    by = rate <= 3 ? 'Unsatisfied customer' : 'Satisfied customer';
+  }
+  return `
         <div class="review-card">
           <p>${r.text}</p>
           <p><em>By ${by} — Rating: ${r.rating}/5</em></p>
         </div>`;
-      }).join('')
+}
+function displayReviews(reviews) {
+  const container = document.getElementById('reviews');
+  if (!container) return;
+  container.innerHTML = reviews.length
+    ? reviews.map(reviewCard).join('')
     : '<p>No reviews yet.</p>';
 }
 